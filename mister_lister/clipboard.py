@@ -0,0 +1,61 @@
+"""
+Clipboard formatting for MisterLister.
+Turns table rows into tab-separated text and an HTML table in one pass each.
+"""
+
+from html import escape
+from mister_lister.qt import QMimeData
+
+def build_tsv(rows, headers=None):
+    """
+    Build tab-separated text.
+    
+    Args:
+        rows (iterable): Rows of cell strings
+        headers (list): Header row to put first, or None
+        
+    Returns:
+        str: Rows joined by newlines, cells by tabs
+    """
+    lines = map("\t".join, rows)
+    if headers is not None:
+        return "\n".join(["\t".join(headers), *lines])
+    return "\n".join(lines)
+
+def build_html_table(rows, headers=None):
+    """
+    Build an HTML table that spreadsheets and word processors paste as a table.
+    
+    Args:
+        rows (iterable): Rows of cell strings
+        headers (list): Header row, or None
+        
+    Returns:
+        str: HTML document containing one table
+    """
+    parts = ['<html><head><meta charset="utf-8"></head><body><table>']
+    if headers is not None:
+        parts.append("<tr><th>" + "</th><th>".join(map(escape, headers)) + "</th></tr>")
+    parts.extend(
+        "<tr><td>" + "</td><td>".join(map(escape, row)) + "</td></tr>"
+        for row in rows
+    )
+    parts.append("</table></body></html>")
+    return "".join(parts)
+
+def table_mime_data(rows, headers=None):
+    """
+    Package rows for the clipboard as both text/plain and text/html.
+    
+    Args:
+        rows (iterable): Rows of cell strings
+        headers (list): Header row, or None
+        
+    Returns:
+        QMimeData: Clipboard data with TSV text and an HTML table
+    """
+    rows = rows if isinstance(rows, list) else list(rows)
+    mime = QMimeData()
+    mime.setText(build_tsv(rows, headers))
+    mime.setHtml(build_html_table(rows, headers))
+    return mime
@@ -27,11 +27,18 @@ DEFAULT_REMEMBER_DIR = True
 DEFAULT_REMEMBER_LAYOUT = False
 DEFAULT_SHOW_DIALOG = False
 
+# Parsing settings
+DEFAULT_PARALLEL_THRESHOLD = 20000  # Rows before parsing moves to a process pool
+DEFAULT_BATCH_SIZE = 1000  # Files per batch when streaming folders into the table
+CONFIG_WRITE_DELAY = 0.5  # Seconds of quiet before config changes are written
+
 __all__ = [
     'WINDOW_BG', 'INACTIVE_TAN', 'DARKER_TAN',
     'NORMAL_TAN', 'HOVER_TAN', 'LIGHT_BLUE', 'WHITE',
     'DEFAULT_FONT_SIZE', 'DEFAULT_ROW_SPACING',
     'MIN_WINDOW_WIDTH', 'MIN_WINDOW_HEIGHT',
     'DEFAULT_MARGIN', 'DEFAULT_BORDER_STYLE', 'DEFAULT_BORDER_GRAY',
-    'DEFAULT_REMEMBER_DIR', 'DEFAULT_REMEMBER_LAYOUT', 'DEFAULT_SHOW_DIALOG'
+    'DEFAULT_REMEMBER_DIR', 'DEFAULT_REMEMBER_LAYOUT', 'DEFAULT_SHOW_DIALOG',
+    'DEFAULT_PARALLEL_THRESHOLD', 'DEFAULT_BATCH_SIZE',
+    'CONFIG_WRITE_DELAY'
 ] 
\ No newline at end of file
@@ -2,6 +2,8 @@
 import os
 import sys
 import tempfile
+from contextlib import contextmanager
+from itertools import chain
 
 # Set Python's cache directory to system temp
 os.environ['PYTHONPYCACHEPREFIX'] = tempfile.gettempdir()
@@ -11,11 +13,10 @@ Main editor component for MisterLister.
 """
 
 from mister_lister.qt import (
-    QMainWindow, QWidget, QVBoxLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMenu, QAction,
-    QDragEnterEvent, QDropEvent, QPrinter, 
-    QPrintPreviewDialog, QTextDocument, QTextCursor,
-    QDialog, Qt, QFileDialog, QFontDatabase, QSettings, QTimer, QPainter, QRectF, QColor, QMarginsF, QPageLayout,
+    QMainWindow, QWidget, QVBoxLayout, QTableView,
+    QAbstractItemView, QHeaderView, QMenu, QAction,
+    QDragEnterEvent, QDropEvent, QTextCursor,
+    QDialog, Qt, QFileDialog, QSettings, QTimer, QPainter, QRectF, QColor, QMarginsF, QPageLayout,
     QFont, QIcon, QApplication
 )
 from mister_lister.constants import (
@@ -24,9 +25,48 @@ from mister_lister.constants import (
     DEFAULT_FONT_SIZE, DEFAULT_ROW_SPACING
 )
 from mister_lister.ui.widgets import DropZone
-from mister_lister.ui.dialogs import ConfigDialog, ConfirmDialog
 from mister_lister.ui.bottom_bar import BottomBar
-from mister_lister.utils import split_by_type, convert_short_date, Config
+from mister_lister.utils import (
+    load_schema, walk_config_batches, iter_batches, PathIndex,
+    TrigramIndex, key_functions_for, Config
+)
+from mister_lister.printing import PrintLayout, TablePainter, page_geometry_key
+from mister_lister.clipboard import table_mime_data
+from mister_lister.fonts import register_fonts, STARTUP_STYLES
+from mister_lister.startup_profile import startup_profile
+from mister_lister.workers import IngestWorker, PrintQueue
+from mister_lister.print_jobs import PrintJob, group_positions, job_file_name
+from mister_lister.ui.table_model import ListTableModel
+from mister_lister.ui.filter_proxy import FilterProxyModel
+from mister_lister.ui.table_zoom import TableZoom
+
+INGEST_ROWS_PER_UPDATE = 2000  # Rows added to the table per event-loop turn
+FILTER_DELAY_MS = 150  # Wait for typing to pause before filtering
+
+def flip_order(order):
+    """Get the opposite sort order"""
+    if order == Qt.SortOrder.AscendingOrder:
+        return Qt.SortOrder.DescendingOrder
+    return Qt.SortOrder.AscendingOrder
+
+def merge_row_ranges(ranges):
+    """
+    Merge row ranges into contiguous blocks.
+    
+    Args:
+        ranges (iterable): (first_row, last_row) pairs, in any order, may overlap
+        
+    Returns:
+        list: Sorted, non-overlapping (first_row, count) pairs
+    """
+    blocks = []
+    for first, last in sorted(ranges):
+        if blocks and first <= blocks[-1][0] + blocks[-1][1]:
+            start, count = blocks[-1]
+            blocks[-1] = (start, max(count, last - start + 1))
+        else:
+            blocks.append((first, last - first + 1))
+    return blocks
 
 class FileEditor(QMainWindow):
     """
@@ -37,19 +77,14 @@ class FileEditor(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Try loading Asap font family
-        try:
-            QFontDatabase.addApplicationFont("assets/fonts/Asap-Regular.ttf")
-            QFontDatabase.addApplicationFont("assets/fonts/Asap-Medium.ttf")
-            QFontDatabase.addApplicationFont("assets/fonts/Asap-Bold.ttf") 
-            QFontDatabase.addApplicationFont("assets/fonts/Asap-Italic.ttf")
-            QFontDatabase.addApplicationFont("assets/fonts/Asap-MediumItalic.ttf")
-            QFontDatabase.addApplicationFont("assets/fonts/Asap-BoldItalic.ttf")
-        except:
-            print("Font files not found. Using system fonts.")
+        # Load the Asap styles the window shows; dialogs register the rest
+        with startup_profile.phase("fonts"):
+            register_fonts(*STARTUP_STYLES)
         
         # Initialize settings
-        self.config = Config()
+        with startup_profile.phase("config"):
+            self.config = Config()
+            self.schema = load_schema(self.config)
         self.setWindowTitle("MisterLister")
         self.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
         
@@ -67,9 +102,12 @@ class FileEditor(QMainWindow):
         self.layout.setContentsMargins(0, 0, 0, 0)
         
         # Initialize UI components
-        self.setup_drop_zone()
-        self.setup_table()
-        self.setup_bottom_bar()
+        with startup_profile.phase("setup_drop_zone"):
+            self.setup_drop_zone()
+        with startup_profile.phase("setup_table"):
+            self.setup_table()
+        with startup_profile.phase("setup_bottom_bar"):
+            self.setup_bottom_bar()
         
         # Set initial values based on config
         if self.config.get_bool('layout/remember_config'):
@@ -80,7 +118,16 @@ class FileEditor(QMainWindow):
             self.current_spacing = DEFAULT_ROW_SPACING
         self.printer_name = self.config.get_str('print/printer_name')
         
-        self.update_window_style()
+        # Apply starting zoom, then debounce later changes
+        with startup_profile.phase("zoom and window style"):
+            self.zoom = TableZoom(self.table, self.current_font_size, self.current_spacing, parent=self)
+            self.zoom.apply()
+            self.zoom.applied.connect(self.save_zoom)
+            
+            self.update_window_style()
+        
+        # Render the remaining button icon looks once the window is up
+        QTimer.singleShot(0, self.bottom_bar.prewarm_icons)
         
         # Show add files dialog on startup if enabled
         if self.config.get_bool('startup/show_dialog'):
@@ -88,6 +135,29 @@ class FileEditor(QMainWindow):
         
         # Pre-create dialogs
         self.confirm_dialog = None
+        
+        # Laid-out print pages, reused while nothing they depend on changes
+        self.print_cache = None
+        
+        # Background print and PDF export jobs
+        self.print_queue = PrintQueue(self)
+        self.print_queue.changed.connect(self.update_job_progress)
+        self.job_dialog = None
+        
+        # Source paths already in the table
+        self.path_index = PathIndex()
+        
+        # Cell text search for the filter box
+        self.search_index = TrigramIndex()
+        
+        # Background import state
+        self.ingest_worker = None
+        self.ingest_finished = False
+        self.ingest_done = 0
+        self.queued_paths = []
+        
+        # Accept file and folder drops anywhere in the window
+        self.setAcceptDrops(True)
 
     def setup_drop_zone(self):
         """Initialize the drop zone"""
@@ -96,13 +166,24 @@ class FileEditor(QMainWindow):
 
     def setup_table(self):
         """Initialize the table widget"""
-        self.table = QTableWidget()
+        self.model = ListTableModel(parent=self)
+        self.model.rows_edited.connect(self.reindex_rows)
+        self.proxy = FilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setVisible(False)
-        self.table.setSortingEnabled(True)
+        
+        # Sort only when a header is clicked (shift-click adds a tie-breaker column)
+        header = self.table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        header.sectionClicked.connect(self.sort_by_header)
         
         # Set selection behaviors
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select whole rows
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)  # Allow multiple selection with modifiers
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)  # Select whole rows
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)  # Allow multiple selection with modifiers
         
         # Set initial font size
         font = self.table.font()
@@ -115,7 +196,7 @@ class FileEditor(QMainWindow):
         
         # Set table style
         self.table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {WHITE};
                 border: none;
                 gridline-color: #ddd;
@@ -128,11 +209,11 @@ class FileEditor(QMainWindow):
                 border-bottom: 1px solid #ddd;
                 color: #666;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 color: black;
                 background-color: {WHITE};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {LIGHT_BLUE};
                 color: {WHITE};
             }}
@@ -143,7 +224,7 @@ class FileEditor(QMainWindow):
         self.setup_table_context_menus()
         
         # Enable copy/paste
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         
         # Install event filter for keyboard shortcuts
         self.table.installEventFilter(self)
@@ -155,14 +236,28 @@ class FileEditor(QMainWindow):
         
         # Connect button signals
         self.bottom_bar.add_files_btn.clicked.connect(self.add_files)
+        self.bottom_bar.add_files_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.bottom_bar.add_files_btn.customContextMenuRequested.connect(self.show_add_menu)
         self.bottom_bar.font_minus_btn.clicked.connect(lambda: self.adjust_font(-1))
         self.bottom_bar.font_plus_btn.clicked.connect(lambda: self.adjust_font(1))
         self.bottom_bar.spacing_minus_btn.clicked.connect(lambda: self.adjust_spacing(-2))
         self.bottom_bar.spacing_plus_btn.clicked.connect(lambda: self.adjust_spacing(2))
         self.bottom_bar.preview_btn.clicked.connect(self.preview_document)
         self.bottom_bar.print_btn.clicked.connect(self.print_document)
+        self.bottom_bar.print_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.bottom_bar.print_btn.customContextMenuRequested.connect(self.show_print_menu)
+        self.bottom_bar.jobs_btn.clicked.connect(self.show_print_jobs)
+        self.bottom_bar.cancel_jobs_btn.clicked.connect(self.cancel_print_jobs)
         self.bottom_bar.clear_btn.clicked.connect(self.clear_table)
         self.bottom_bar.config_btn.clicked.connect(self.show_config)
+        self.bottom_bar.cancel_import_btn.clicked.connect(self.cancel_ingest)
+        
+        # Filter once typing pauses
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.bottom_bar.filter_box.textChanged.connect(self.filter_timer.start)
 
     def update_window_style(self):
         """Update the window's style"""
@@ -184,56 +279,272 @@ class FileEditor(QMainWindow):
         if files:
             if self.config.get_bool('files/remember_dir'):
                 self.config.set_value('files/default_dir', os.path.dirname(files[0]))
-            self.process_files(files)
+            self.ingest_paths(files)
         # If this was called on startup and no files selected, show drop zone
         elif not self.table.isVisible():
             self.drop_zone.setVisible(True)
             self.table.setVisible(False)
             self.bottom_bar.set_controls_enabled(False)
 
-    def process_files(self, files):
-        """Process the list of files and add them to the table"""
+    def add_folder(self):
+        """Open folder dialog to add a folder's files recursively"""
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            "Select Folder",
+            self.config.get_str('files/default_dir'),
+            QFileDialog.Option.ShowDirsOnly
+        )
+        
+        if folder:
+            if self.config.get_bool('files/remember_dir'):
+                self.config.set_value('files/default_dir', folder)
+            self.ingest_paths([folder])
+
+    def show_add_menu(self, pos):
+        """Show context menu for the add files button"""
+        button = self.bottom_bar.add_files_btn
+        menu = QMenu(self)
+        files_action = QAction("Add Files...", self)
+        files_action.triggered.connect(self.add_files)
+        menu.addAction(files_action)
+        
+        folder_action = QAction("Add Folder...", self)
+        folder_action.triggered.connect(self.add_folder)
+        menu.addAction(folder_action)
+        
+        menu.exec(button.mapToGlobal(pos))
+
+    def show_print_menu(self, pos):
+        """Show context menu for the print button"""
+        button = self.bottom_bar.print_btn
+        menu = QMenu(self)
+        print_action = QAction("Print", self)
+        print_action.triggered.connect(self.print_document)
+        menu.addAction(print_action)
+        
+        batch_action = QAction("Batch Print...", self)
+        batch_action.triggered.connect(self.batch_print)
+        menu.addAction(batch_action)
+        
+        export_action = QAction("Export PDF...", self)
+        export_action.triggered.connect(self.export_pdf)
+        menu.addAction(export_action)
+        
+        if self.print_queue.jobs:
+            jobs_action = QAction("Show Print Jobs", self)
+            jobs_action.triggered.connect(self.show_print_jobs)
+            menu.addAction(jobs_action)
+        
+        menu.exec(button.mapToGlobal(pos))
+
+    def ingest_paths(self, paths):
+        """
+        Add files and folders to the table in the background.
+        
+        Folders are walked recursively and parsed on a worker thread; rows
+        arrive in bounded batches so the window stays responsive. Paths
+        added while an import is running are queued behind it.
+        """
+        self.queued_paths.append(list(paths))
+        if self.ingest_worker is None:
+            self.start_next_ingest()
+
+    def start_next_ingest(self):
+        """Start a worker for the next queued group of paths"""
+        if not self.queued_paths:
+            self.bottom_bar.hide_progress()
+            return
+        
+        paths = self.queued_paths.pop(0)
+        has_folders = any(os.path.isdir(path) for path in paths)
+        if not has_folders:
+            paths = self.new_paths(paths)
+            if not paths:
+                self.start_next_ingest()
+                return
+        
+        parallel_threshold = self.config.get_int('files/parallel_threshold')
+        if has_folders:
+            batches = walk_config_batches(paths, self.config)
+            total = 0
+        else:
+            # Batches big enough to use the process pool, small enough to cancel between
+            batch_size = max(1, self.config.get_int('files/batch_size'), parallel_threshold)
+            batches = iter_batches(paths, batch_size)
+            total = len(paths)
+        
+        worker = IngestWorker(batches, self.schema, parallel_threshold, total, self)
+        worker.rows_available.connect(self.drain_ingest_rows)
+        worker.finished.connect(self.finish_ingest)
+        self.ingest_worker = worker
+        self.ingest_finished = False
+        self.ingest_done = 0
+        self.bottom_bar.show_progress(0, total)
+        
+        # Rows are appended as they arrive; an active sort is reapplied once at the end
+        self.model.begin_bulk()
+        worker.start()
+
+    def drain_ingest_rows(self):
+        """Move one bounded batch of parsed rows into the table"""
+        worker = self.ingest_worker
+        if worker is None:
+            return
+        
+        entries, more = worker.take_rows(INGEST_ROWS_PER_UPDATE)
+        if entries and not worker.cancelled:
+            paths, rows = zip(*entries)
+            self.insert_rows(rows, paths)
+            
+            # Progress counts files added to the table, not just parsed
+            self.ingest_done += len(entries)
+            self.bottom_bar.show_progress(self.ingest_done, worker.total)
+        
+        if more:
+            # Let the table repaint before the next batch
+            QTimer.singleShot(0, self.drain_ingest_rows)
+        elif self.ingest_finished:
+            self.ingest_worker = None
+            worker.deleteLater()
+            self.model.end_bulk()
+            self.start_next_ingest()
+
+    def finish_ingest(self):
+        """Handle the worker thread ending, then add its last rows"""
+        self.ingest_finished = True
+        self.drain_ingest_rows()
+
+    def cancel_ingest(self):
+        """Stop the running import and drop anything still queued"""
+        self.queued_paths = []
+        if self.ingest_worker is not None:
+            self.ingest_worker.cancel()
+        self.bottom_bar.hide_progress()
+
+    def new_paths(self, paths):
+        """Drop already-listed paths when duplicates are skipped"""
+        if self.config.get_str('files/duplicates') != 'skip':
+            return list(paths)
+        return [path for path in paths if path not in self.path_index]
+
+    def insert_rows(self, rows, paths=None):
+        """
+        Add parsed rows to the table.
+        
+        Args:
+            rows (list): Parsed rows of cell strings
+            paths (list): Source path of each row, used to skip or replace
+                files that are already listed (no duplicate check if None)
+        """
         if not self.table.isVisible():
             self.table.setVisible(True)
             self.drop_zone.setVisible(False)
             self.bottom_bar.set_controls_enabled(True)
             
             # Initialize table headers with descriptive labels
-            self.table.setColumnCount(5)
-            self.table.setHorizontalHeaderLabels([
-                "lastname", "firstname", "dob", "item", "date"
-            ])
+            self.model.set_headers(
+                self.schema.headers, key_functions_for(self.schema.types)
+            )
             header = self.table.horizontalHeader()
-            for i in range(5):
+            for i in range(self.schema.column_count):
                 header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
         
         # Update add_files button state
         self.bottom_bar.add_files_btn.in_use = True
-
-        # Add new files to table
-        for file_path in files:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
+        
+        with self.bulk_insert() as model:
+            if paths is None:
+                self.search_index.add_many(model.append_rows(rows), rows)
+                return
             
-            filename = os.path.basename(file_path)
-            segments = split_by_type(filename)
-            if len(segments) >= 6:
-                segments = segments[:5]
-                
-            # Add segments to columns
-            for col, segment in enumerate(segments):
-                if col in [2, 4]:  # Convert dates in columns 3 and 5
-                    item = QTableWidgetItem(convert_short_date(segment.strip()))
-                else:
-                    item = QTableWidgetItem(segment.strip())
-                self.table.setItem(row_position, col, item)
-                
-            # Fill empty columns
-            for col in range(len(segments), 5):
-                self.table.setItem(row_position, col, QTableWidgetItem(""))
+            # Skip or replace already-listed files, keeping the rest in order
+            replace = self.config.get_str('files/duplicates') == 'replace'
+            new_rows = []
+            new_paths = []
+            replacements = []
+            for row, path in zip(rows, paths):
+                row_id = self.path_index.get(path)
+                if row_id is None:
+                    # Claim the path now so repeats within this batch are caught
+                    self.path_index.add(path, -1)
+                    new_rows.append(row)
+                    new_paths.append(path)
+                elif replace and row_id >= 0:
+                    replacements.append((model.position_of(row_id), row))
             
-            # Set row height (convert to int)
-            self.table.setRowHeight(row_position, int(self.current_spacing))
+            model.set_rows(replacements)
+            new_ids = model.append_rows(new_rows, new_paths)
+            for path, row_id in zip(new_paths, new_ids):
+                self.path_index.add(path, row_id)
+            self.search_index.add_many(new_ids, new_rows)
+
+    @contextmanager
+    def bulk_insert(self):
+        """
+        Group table changes into one transaction.
+        
+        View updates pause and any active sort is deferred, so the table
+        re-sorts and repaints once when the block ends.
+        
+        Yields:
+            ListTableModel: The table model to change
+        """
+        self.table.setUpdatesEnabled(False)
+        try:
+            with self.model.bulk_insert():
+                yield self.model
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.update_filter_count()
+
+    def apply_filter(self):
+        """Show only rows containing the filter box text"""
+        self.filter_timer.stop()
+        query = self.bottom_bar.filter_box.text().strip()
+        if query:
+            self.proxy.set_filter(query, self.search_index.search(query))
+        else:
+            self.proxy.clear_filter()
+        self.update_filter_count()
+
+    def update_filter_count(self):
+        """Show how many rows the filter lets through"""
+        if self.proxy.filtered:
+            self.bottom_bar.show_filter_count(self.proxy.rowCount(), self.model.rowCount())
+        else:
+            self.bottom_bar.hide_filter_count()
+
+    def reindex_rows(self, row_ids):
+        """Update the search index for edited rows"""
+        for row_id in row_ids:
+            row = self.model.position_of(row_id)
+            if row >= 0:
+                self.search_index.update(row_id, self.model.row_values(row))
+
+    def sort_by_header(self, column):
+        """
+        Sort by a clicked column header.
+        
+        A plain click sorts by that column, flipping the order if it's
+        already the main sort. Shift-click adds the column as a tie-breaker
+        (or flips it if it's already one), e.g. date then lastname.
+        """
+        spec = list(self.model.sort_spec)
+        orders = dict(spec)
+        shift = QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier
+        
+        if shift and spec:
+            if column in orders:
+                spec = [(col, flip_order(order) if col == column else order) for col, order in spec]
+            else:
+                spec.append((column, Qt.SortOrder.AscendingOrder))
+        elif spec and spec[0][0] == column:
+            spec = [(column, flip_order(spec[0][1]))]
+        else:
+            spec = [(column, Qt.SortOrder.AscendingOrder)]
+        
+        self.model.sort_by(spec)
+        self.table.horizontalHeader().setSortIndicator(*spec[0])
 
     def setup_table_context_menus(self):
         """Setup context menus for the table"""
@@ -260,7 +571,7 @@ class FileEditor(QMainWindow):
     def show_cell_menu(self, pos):
         """Show context menu for table cells"""
         menu = QMenu(self)
-        if self.table.selectedItems():
+        if self.table.selectionModel().hasSelection():
             copy_action = QAction("Copy", self)
             copy_action.triggered.connect(self.copy_selection)
             menu.addAction(copy_action)
@@ -272,23 +583,71 @@ class FileEditor(QMainWindow):
 
     def show_all_columns(self):
         """Show all hidden columns"""
-        for i in range(self.table.columnCount()):
+        for i in range(self.model.columnCount()):
             self.table.showColumn(i)
 
     def delete_selected_rows(self):
-        """Delete selected rows from the table"""
-        rows = set(item.row() for item in self.table.selectedItems())
-        for row in sorted(rows, reverse=True):
-            self.table.removeRow(row)
+        """
+        Delete selected rows from the table.
+        
+        The selection is merged into contiguous blocks of table rows and
+        each block is removed in one step, dropping its rows from the
+        duplicate and search indexes on the way.
+        """
+        blocks = self.selected_row_blocks()
+        if blocks == [(0, self.model.rowCount())]:
+            # Everything is selected; reset the indexes instead of row by row
+            self.path_index.clear()
+            self.search_index.clear()
+        else:
+            for start, count in blocks:
+                for row in range(start, start + count):
+                    self.forget_row(row)
         
-        if self.table.rowCount() == 0:
+        # Remove the bottom block first so earlier block positions stay valid
+        self.table.setUpdatesEnabled(False)
+        try:
+            for start, count in reversed(blocks):
+                self.model.removeRows(start, count)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self.update_filter_count()
+        
+        if self.model.rowCount() == 0:
             self.table.setVisible(False)
             self.drop_zone.setVisible(True)
             self.bottom_bar.set_controls_enabled(False)
             self.bottom_bar.add_files_btn.in_use = False
 
+    def selected_row_blocks(self):
+        """
+        Get the selected table rows as contiguous blocks.
+        
+        Returns:
+            list: Sorted, non-overlapping (first_row, count) pairs in model rows
+        """
+        ranges = [(range_.top(), range_.bottom()) for range_ in self.table.selectionModel().selection()]
+        if self.proxy.filtered:
+            # Neighbouring filtered rows may be far apart in the model
+            ranges = [
+                (self.proxy.source_row(row),) * 2
+                for top, bottom in ranges
+                for row in range(top, bottom + 1)
+            ]
+        return merge_row_ranges(ranges)
+
+    def forget_row(self, row):
+        """Remove a row from the duplicate and search indexes"""
+        path = self.model.path(row)
+        if path:
+            self.path_index.discard(path)
+        self.search_index.remove(self.model.row_id(row))
+
     def show_config(self):
         """Show configuration dialog"""
+        # Dialogs are imported when first opened, keeping them off the startup path
+        from mister_lister.ui.dialogs import ConfigDialog
+        
         self.bottom_bar.config_btn.in_use = True
         self.config_dialog = ConfigDialog(self)
         
@@ -299,15 +658,24 @@ class FileEditor(QMainWindow):
         self.config_dialog.exec()
         self.bottom_bar.config_btn.in_use = False
 
-    def preview_document(self):
-        """Show print preview dialog"""
-        self.bottom_bar.preview_btn.in_use = True
+    def create_printer(self):
+        """Create a high-resolution printer for the configured printer"""
+        # Print support is loaded on first print or preview, not at startup
+        from mister_lister.qt import QPrinter
+        
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         if self.printer_name:
             printer.setPrinterName(self.printer_name)
+        return printer
+
+    def preview_document(self):
+        """Show print preview dialog"""
+        self.bottom_bar.preview_btn.in_use = True
+        printer = self.create_printer()
         
+        from mister_lister.qt import QPrintPreviewDialog
         preview = QPrintPreviewDialog(printer, self)
-        preview.paintRequested.connect(self.print_table)
+        preview.paintRequested.connect(self.paint_preview)
         
         # Create proper function for state change
         def reset_preview_state():
@@ -319,9 +687,7 @@ class FileEditor(QMainWindow):
     def print_document(self):
         """Print the document directly"""
         self.bottom_bar.print_btn.in_use = True
-        printer = QPrinter(QPrinter.PrinterMode.HighResolution)
-        if self.printer_name:
-            printer.setPrinterName(self.printer_name)
+        printer = self.create_printer()
         self.print_table(printer)
         
         # Create proper function for state change
@@ -332,80 +698,217 @@ class FileEditor(QMainWindow):
         QTimer.singleShot(2000, reset_print_state)
 
     def print_table(self, printer):
-        """Print the table with current config"""
-        # Get border config from config
-        border_style = self.config.get_str('print/border_style')
-        border_gray = self.config.get_int('print/border_gray')
-        border_color = f"rgb({border_gray}, {border_gray}, {border_gray})"
-        
-        # Create HTML with explicit sizing
-        html = f"""
-            <style>
-                body {{
-                    font-size: {int(self.current_font_size)}pt;
-                    font-family: 'Asap';
-                    padding: 0;
-                }}
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    table-layout: fixed;
-                }}
-                tr {{
-                    height: {int(self.current_spacing)}px !important;
-                    line-height: {int(self.current_spacing)}px !important;
-                }}
-                td, th {{
-                    padding: 4px;
-                    border: 1px {border_style} {border_color};
-                    text-align: center;
-                    vertical-align: middle;
-                    overflow: hidden;
-                    height: {int(self.current_spacing)}px !important;
-                }}
-            </style>
-            <table>
+        """Print the table with current config, laying out one page at a time"""
+        layout = PrintLayout.from_config(
+            self.config, self.current_font_size, self.current_spacing
+        )
+        headers, rows = self.visible_table_data(self.visible_columns())
+        table = TablePainter(printer, headers, layout, self.zoom.font(self.current_font_size))
+        table.print_pages(printer, table.pages(rows))
+
+    def paint_preview(self, printer):
+        """
+        Paint the print preview with current config.
+        
+        The laid-out pages are cached, so the preview can repaint (or be
+        reopened) without paginating again until the rows, visible columns,
+        zoom, border settings or page setup change. Direct printing uses
+        print_table instead and never holds every page in memory.
+        """
+        layout = PrintLayout.from_config(
+            self.config, self.current_font_size, self.current_spacing
+        )
+        columns = self.visible_columns()
+        key = (
+            self.model.version, self.proxy.query, tuple(columns),
+            layout.font_size, layout.spacing, layout.border_style, layout.border_gray,
+            page_geometry_key(printer)
+        )
+        
+        if self.print_cache is None or self.print_cache[0] != key:
+            headers, rows = self.visible_table_data(columns)
+            table = TablePainter(printer, headers, layout, self.zoom.font(self.current_font_size))
+            self.print_cache = (key, table, list(table.pages(rows)))
+        
+        _, table, pages = self.print_cache
+        table.print_pages(printer, pages)
+
+    def export_pdf(self):
+        """
+        Export the list to a PDF in the background.
+        
+        A snapshot of the visible rows is queued as a print job and painted
+        on a worker thread with the same page layout and border settings as
+        printing, so the table stays usable while the file is written.
+        """
+        if self.model.rowCount() == 0:
+            return
+        
+        out_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export PDF",
+            os.path.join(self.config.get_str('files/default_dir'), "list.pdf"),
+            "PDF Files (*.pdf)"
+        )
+        if not out_path:
+            return
+        if not out_path.lower().endswith('.pdf'):
+            out_path += '.pdf'
+        
+        self.queue_print_jobs(self.build_print_jobs(pdf_path=out_path))
+
+    def batch_print(self):
+        """Print or export the list as a batch, optionally one job per column value"""
+        if self.model.rowCount() == 0:
+            return
+        
+        from mister_lister.ui.dialogs import BatchPrintDialog
+        dialog = BatchPrintDialog(self.model.headers, self.printer_name, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        
+        pdf_dir = None
+        if dialog.to_pdf:
+            pdf_dir = QFileDialog.getExistingDirectory(
+                self,
+                "Select Folder for PDFs",
+                self.config.get_str('files/default_dir'),
+                QFileDialog.Option.ShowDirsOnly
+            )
+            if not pdf_dir:
+                return
+        
+        self.queue_print_jobs(self.build_print_jobs(dialog.split_column, pdf_dir=pdf_dir))
+        self.show_print_jobs()
+
+    def build_print_jobs(self, split_column=None, pdf_path=None, pdf_dir=None):
         """
+        Snapshot the visible rows as print jobs.
         
-        # Add headers
-        html += "<tr>"
-        for col in range(self.table.columnCount()):
-            if not self.table.isColumnHidden(col):
-                header = self.table.horizontalHeaderItem(col)
-                html += f"<th>{header.text() if header else ''}</th>"
-        html += "</tr>"
-        
-        # Add data rows
-        for row in range(self.table.rowCount()):
-            html += "<tr>"
-            for col in range(self.table.columnCount()):
-                if not self.table.isColumnHidden(col):
-                    item = self.table.item(row, col)
-                    html += f"<td>{item.text() if item else ''}</td>"
-            html += "</tr>"
-        
-        html += "</table>"
-        
-        # Create document and print
-        document = QTextDocument()
-        document.setDefaultFont(self.table.font())
-        document.setHtml(html)
-        document.print(printer)
+        Args:
+            split_column (int): Model column to split by (one job per
+                distinct value, in one grouping pass), or None for one job
+            pdf_path (str): Write the single job to this PDF
+            pdf_dir (str): Write each job to its own PDF in this folder
+            
+        Returns:
+            list: PrintJob objects
+        """
+        columns = self.visible_columns()
+        headers = [self.model.headers[col] for col in columns]
+        positions = self.proxy.source_rows()
+        layout = PrintLayout.from_config(
+            self.config, self.current_font_size, self.current_spacing
+        )
+        font = self.zoom.font(self.current_font_size)
+        
+        if split_column is None:
+            rows = list(self.model.rows(columns, positions))
+            target = pdf_path or (pdf_dir and os.path.join(pdf_dir, "list.pdf"))
+            return [PrintJob("whole list", headers, rows, layout, font, self.printer_name, target)]
+        
+        jobs = []
+        used_names = set()
+        header = self.model.headers[split_column]
+        groups = group_positions(self.model.column_values(split_column), positions)
+        for value, group in groups.items():
+            target = None
+            if pdf_dir:
+                name = job_file_name(header, value)
+                stem = name[:-len('.pdf')]
+                count = 1
+                while name in used_names:
+                    count += 1
+                    name = f"{stem}_{count}.pdf"
+                used_names.add(name)
+                target = os.path.join(pdf_dir, name)
+            rows = list(self.model.rows(columns, group))
+            jobs.append(PrintJob(
+                f"{header} {value or '(blank)'}", headers, rows,
+                layout, font, self.printer_name, target
+            ))
+        return jobs
+
+    def queue_print_jobs(self, jobs):
+        """Add jobs to the background print queue"""
+        self.print_queue.add(jobs, self.create_printer().pageLayout())
+
+    def update_job_progress(self):
+        """Show print queue progress in the bottom bar"""
+        if not self.print_queue.busy:
+            self.bottom_bar.hide_job_progress()
+            return
+        done, total, running = self.print_queue.progress()
+        if running is not None:
+            self.bottom_bar.show_job_progress(done, total, running.pages_done, running.page_total)
+        else:
+            self.bottom_bar.show_job_progress(done, total)
+
+    def show_print_jobs(self):
+        """Show the print job status view"""
+        if self.job_dialog is None:
+            from mister_lister.ui.dialogs import JobQueueDialog
+            self.job_dialog = JobQueueDialog(self.print_queue, self)
+        self.job_dialog.show()
+        self.job_dialog.raise_()
+
+    def cancel_print_jobs(self):
+        """Stop the running print job and drop the waiting ones"""
+        self.print_queue.cancel()
+
+    def visible_table_data(self, columns=None):
+        """
+        Get headers and cell text for the visible columns.
+        
+        Only rows that pass the filter are included.
+        
+        Args:
+            columns (list): Visible columns, if already known
+        
+        Returns:
+            tuple: (headers, rows) where rows yields tuples of cell strings
+        """
+        if columns is None:
+            columns = self.visible_columns()
+        headers = [self.model.headers[col] for col in columns]
+        positions = self.proxy.source_rows() if self.proxy.filtered else None
+        return headers, self.model.rows(columns, positions)
+
+    def visible_columns(self, first=0, last=None):
+        """
+        Get the model columns that aren't hidden.
+        
+        Args:
+            first (int): First column to consider
+            last (int): Last column to consider (the final column if None)
+        """
+        if last is None:
+            last = self.model.columnCount() - 1
+        return [
+            col for col in range(first, last + 1)
+            if not self.table.isColumnHidden(col)
+        ]
 
     def clear_table(self):
         """Clear all entries from the table after confirmation"""
-        if self.table.rowCount() > 0:
+        if self.model.rowCount() > 0:
             self.bottom_bar.clear_btn.in_use = True
             
             # Create dialog only if needed
             if not self.confirm_dialog:
+                from mister_lister.ui.dialogs import ConfirmDialog
                 self.confirm_dialog = ConfirmDialog(self)
             
             result = self.confirm_dialog.exec()
             self.bottom_bar.clear_btn.in_use = False
             
             if result == QDialog.DialogCode.Accepted:
-                self.table.setRowCount(0)
+                self.cancel_ingest()
+                self.model.clear()
+                self.path_index.clear()
+                self.search_index.clear()
+                self.print_cache = None
+                self.update_filter_count()
                 self.table.setVisible(False)
                 self.drop_zone.setVisible(True)
                 self.bottom_bar.set_controls_enabled(False)
@@ -413,17 +916,7 @@ class FileEditor(QMainWindow):
     def adjust_font(self, delta):
         """Adjust the font size"""
         self.current_font_size = max(8, min(72, self.current_font_size + delta))
-        font = self.table.font()
-        font.setPointSize(int(self.current_font_size))  # Convert to int for setPointSize
-        self.table.setFont(font)
-        
-        # Update row heights to maintain proportions
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, int(self.current_spacing))
-            
-        # Save to config if remember settings is enabled
-        if self.config.get_bool('layout/remember_config'):
-            self.config.set_value('layout/font_size', self.current_font_size)
+        self.zoom.set_font_size(self.current_font_size)
         
         # Update any open config dialog
         if hasattr(self, 'config_dialog') and self.config_dialog.isVisible():
@@ -432,17 +925,18 @@ class FileEditor(QMainWindow):
     def adjust_spacing(self, delta):
         """Adjust the row spacing"""
         self.current_spacing = max(20, min(100, self.current_spacing + delta))
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, int(self.current_spacing))  # Convert to int
-            
-        # Save to config if remember settings is enabled
-        if self.config.get_bool('layout/remember_config'):
-            self.config.set_value('layout/row_spacing', self.current_spacing)
-            
+        self.zoom.set_spacing(self.current_spacing)
+        
         # Update any open config dialog
         if hasattr(self, 'config_dialog') and self.config_dialog.isVisible():
             self.config_dialog.format_group.row_height.setText(str(int(self.current_spacing)))
 
+    def save_zoom(self, font_size, spacing):
+        """Save zoom to config once it's applied, if remember settings is enabled"""
+        if self.config.get_bool('layout/remember_config'):
+            self.config.set_value('layout/font_size', font_size)
+            self.config.set_value('layout/row_spacing', spacing)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events for the main window"""
         if event.mimeData().hasUrls():
@@ -452,8 +946,8 @@ class FileEditor(QMainWindow):
             
     def dropEvent(self, event: QDropEvent):
         """Handle drop events for the main window"""
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
-        self.process_files(files)
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        self.ingest_paths(paths)
 
     def eventFilter(self, source, event):
         """Handle keyboard shortcuts"""
@@ -465,53 +959,72 @@ class FileEditor(QMainWindow):
                 elif event.key() == Qt.Key.Key_A:
                     self.table.selectAll()
                     return True
+                elif event.key() == Qt.Key.Key_F:
+                    self.bottom_bar.filter_box.setFocus()
+                    self.bottom_bar.filter_box.selectAll()
+                    return True
         return super().eventFilter(source, event)
 
     def copy_selection(self):
-        """Copy selected cells to clipboard in TSV format"""
-        selected = self.table.selectedRanges()
+        """
+        Copy selected cells to the clipboard.
+        
+        Cells are read straight from the model's columns, skipping hidden
+        columns, and published as tab-separated text plus an HTML table so
+        spreadsheets and word processors paste a formatted table.
+        """
+        selected = list(self.table.selectionModel().selection())
         if not selected:
             return
         
         # Check if entire table is selected (Ctrl+A case)
         all_selected = (
             len(selected) == 1 and
-            selected[0].topRow() == 0 and
-            selected[0].bottomRow() == self.table.rowCount() - 1 and
-            selected[0].leftColumn() == 0 and
-            selected[0].rightColumn() == self.table.columnCount() - 1
+            selected[0].top() == 0 and
+            selected[0].bottom() == self.proxy.rowCount() - 1 and
+            selected[0].left() == 0 and
+            selected[0].right() == self.model.columnCount() - 1
         )
         
-        # Build text with tabs between columns and newlines between rows
-        text = []
-        
-        # Add headers only if Ctrl+A was used
         if all_selected:
-            headers = []
-            for col in range(self.table.columnCount()):
-                if not self.table.isColumnHidden(col):
-                    header = self.table.horizontalHeaderItem(col)
-                    headers.append(header.text() if header else "")
-            text.append("\t".join(headers))
-        
-        # Add selected cell contents
-        for range_ in selected:
-            for row in range(range_.topRow(), range_.bottomRow() + 1):
-                row_data = []
-                for col in range(range_.leftColumn(), range_.rightColumn() + 1):
-                    if not self.table.isColumnHidden(col):
-                        item = self.table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                text.append("\t".join(row_data))
+            # Add headers only if Ctrl+A was used
+            headers, rows = self.visible_table_data()
+        else:
+            headers = None
+            rows = chain.from_iterable(
+                self.model.rows(
+                    self.visible_columns(range_.left(), range_.right()),
+                    self.proxy_positions(range_.top(), range_.bottom())
+                )
+                for range_ in selected
+            )
         
         # Set clipboard content
-        clipboard = QApplication.clipboard()
-        clipboard.setText("\n".join(text))
+        QApplication.clipboard().setMimeData(table_mime_data(rows, headers))
+
+    def proxy_positions(self, top, bottom):
+        """Get the model rows shown at proxy rows top to bottom (inclusive)"""
+        if self.proxy.filtered:
+            return map(self.proxy.source_row, range(top, bottom + 1))
+        return range(top, bottom + 1)
 
     def closeEvent(self, event):
         """Handle window close event"""
+        # Stop any running import or export before the window goes away
+        self.cancel_ingest()
+        if self.ingest_worker is not None:
+            self.ingest_worker.wait()
+        self.print_queue.cancel()
+        self.print_queue.wait()
+        
+        # Save a zoom change that's still waiting out its delay
+        self.zoom.flush()
+        
         # Save window geometry if enabled
         if self.config.get_bool('layout/remember_window'):
             geometry = bytes(self.saveGeometry().data()).hex()
             self.config.set_value('layout/window_geometry', geometry)
+        
+        # Write any settings still waiting out their delay
+        self.config.flush()
         event.accept() 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Font loading for MisterLister.
+Each Asap style is registered with Qt the first time it's needed.
+"""
+
+import os
+import sys
+from mister_lister.qt import QFontDatabase
+
+FONT_FILES = {
+    "Regular": "Asap-Regular.ttf",
+    "Medium": "Asap-Medium.ttf",
+    "Bold": "Asap-Bold.ttf",
+    "Italic": "Asap-Italic.ttf",
+    "MediumItalic": "Asap-MediumItalic.ttf",
+    "BoldItalic": "Asap-BoldItalic.ttf",
+}
+STARTUP_STYLES = ("Regular", "Bold")  # Styles the main window shows
+
+_registered = set()
+
+def fonts_dir():
+    """Get the bundled fonts folder, inside the bundle when running as compiled exe"""
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(base_path, 'assets', 'fonts')
+
+def register_fonts(*styles):
+    """
+    Register bundled Asap font styles with Qt.
+    Styles already registered are skipped, so callers can ask for what they use.
+    
+    Args:
+        *styles (str): Style names from FONT_FILES, e.g. "Bold" (all styles if none given)
+    """
+    for style in styles or FONT_FILES:
+        if style in _registered:
+            continue
+        _registered.add(style)
+        font_path = os.path.join(fonts_dir(), FONT_FILES[style])
+        if QFontDatabase.addApplicationFont(font_path) == -1:
+            print(f"Font file {font_path} not found. Using system fonts.")
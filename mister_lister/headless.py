@@ -0,0 +1,99 @@
+"""
+Headless batch mode for MisterLister.
+Turns filenames into a PDF or CSV list without building any widgets.
+"""
+
+import os
+import sys
+import csv
+from mister_lister.qt import QGuiApplication, QFont
+from mister_lister.utils import (
+    parse_files, load_schema, walk_config_batches,
+    key_functions_for, sort_permutation, Config
+)
+from mister_lister.printing import PrintLayout, print_rows, pdf_writer
+from mister_lister.fonts import register_fonts
+
+def sort_rows(rows, schema, sort_columns):
+    """
+    Sort rows by the named columns, first name taking priority.
+    
+    Uses the same typed sort keys as the table (dates by day, names
+    case-insensitively).
+    
+    Raises:
+        ValueError: If a column name isn't in the schema
+    """
+    spec = []
+    for name in sort_columns or []:
+        if name not in schema.headers:
+            raise ValueError(f"Unknown sort column: {name}")
+        spec.append((schema.headers.index(name), False))
+    if not spec:
+        return
+    
+    key_functions = key_functions_for(schema.types)
+    key_columns = [
+        [key_functions[col](row[col]) for row in rows] if col in dict(spec) else None
+        for col in range(schema.column_count)
+    ]
+    rows[:] = [rows[i] for i in sort_permutation(key_columns, spec, len(rows))]
+
+def write_csv(out_path, headers, rows):
+    """Write headers and rows as CSV"""
+    with open(out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+def write_pdf(out_path, headers, rows, layout):
+    """Render headers and rows to a PDF with the same formatting as printing"""
+    app = QGuiApplication.instance() or QGuiApplication(
+        [sys.argv[0], '-platform', 'offscreen']
+    )
+    register_fonts()
+    
+    writer = pdf_writer(out_path)
+    font = QFont(app.font())
+    font.setPointSize(layout.font_size)
+    print_rows(writer, headers, rows, layout, font)
+
+def run_headless(paths, out_path, sort_columns=None):
+    """
+    Parse, sort and render a list without the GUI.
+    
+    Args:
+        paths (list): Files and/or directories to list
+        out_path (str): Output file ending in .pdf or .csv
+        sort_columns (list): Optional column names to sort by
+        
+    Returns:
+        int: Process exit code
+    """
+    extension = os.path.splitext(out_path)[1].lower()
+    if extension not in ('.pdf', '.csv'):
+        print(f"Error: output must be a .pdf or .csv file: {out_path}")
+        return 2
+    
+    config = Config()
+    schema = load_schema(config)
+    files = [path for batch in walk_config_batches(paths, config) for path in batch]
+    rows = parse_files(
+        files,
+        schema=schema,
+        parallel_threshold=config.get_int('files/parallel_threshold')
+    )
+    
+    try:
+        sort_rows(rows, schema, sort_columns)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+    
+    if extension == '.csv':
+        write_csv(out_path, schema.headers, rows)
+    else:
+        write_pdf(out_path, schema.headers, rows, PrintLayout.from_config(config))
+    
+    print(f"Wrote {len(rows)} rows to {out_path}")
+    return 0
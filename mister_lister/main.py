@@ -2,12 +2,16 @@
 Main entry point for MisterLister application.
 """
 
+import time
+STARTED = time.perf_counter()  # Start of the imports phase for --profile-startup
+
 import os
 import sys
 import ctypes
+import argparse
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
-from mister_lister.editor import FileEditor
 
 def set_app_icon(app):
     """Set application icon with proper Windows taskbar support"""
@@ -38,15 +42,72 @@ def set_app_icon(app):
     else:
         print(f"Warning: Icon file not found at {icon_path}")
 
+def parse_args(argv):
+    """Parse command line options, leaving Qt's own options alone"""
+    parser = argparse.ArgumentParser(prog="mister_lister")
+    parser.add_argument(
+        "--headless", nargs="+", metavar="PATH",
+        help="list these files/directories without opening the window"
+    )
+    parser.add_argument(
+        "--out", metavar="FILE",
+        help="headless output file (.pdf or .csv)"
+    )
+    parser.add_argument(
+        "--sort", action="append", metavar="COLUMN",
+        help="headless sort column (repeat for tie-breakers)"
+    )
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="", metavar="JSON",
+        help="time each startup phase and print the breakdown (or write it to JSON)"
+    )
+    args, _ = parser.parse_known_args(argv)
+    if args.headless and not args.out:
+        parser.error("--headless requires --out")
+    return args
+
 def main():
     """Initialize and run the application"""
-    app = QApplication(sys.argv)
+    # Parallel parsing workers re-enter here when frozen
+    multiprocessing.freeze_support()
+    
+    args = parse_args(sys.argv[1:])
+    
+    # Sort names the way the user's locale does (GUI and headless alike)
+    from mister_lister.utils import use_locale_collation
+    use_locale_collation()
+    
+    if args.headless:
+        # Imported here so batch runs never load the widget modules' setup
+        from mister_lister.headless import run_headless
+        sys.exit(run_headless(args.headless, args.out, args.sort))
+    
+    from mister_lister.startup_profile import startup_profile
+    if args.profile_startup is not None:
+        startup_profile.enable(STARTED)
+    
+    from mister_lister.editor import FileEditor
+    from mister_lister.ui.styles import apply_app_style, time_state_changes
+    startup_profile.record("imports", STARTED)
+    
+    with startup_profile.phase("QApplication"):
+        app = QApplication(sys.argv)
     
-    # Set the application icon
-    set_app_icon(app)
+    # Set the application icon and shared stylesheet
+    with startup_profile.phase("set_app_icon"):
+        set_app_icon(app)
+    with startup_profile.phase("app stylesheet"):
+        apply_app_style(app)
     
     # Create and show the main window
     window = FileEditor()
+    startup_profile.report_after_first_paint(window, args.profile_startup, checks={
+        # Cost of one restyle of the bottom bar's buttons and group labels
+        "bottom bar restyle": lambda: time_state_changes(
+            window.bottom_bar, window.bottom_bar.set_controls_enabled,
+            initial=window.table.isVisible()
+        ),
+    })
     window.show()
     
     sys.exit(app.exec())
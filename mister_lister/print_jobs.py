@@ -0,0 +1,104 @@
+"""
+Print jobs for MisterLister.
+Describes batches of printouts and PDF exports, including one job per group.
+"""
+
+import os
+import re
+
+# Job states, in the order a job moves through them
+WAITING = 'waiting'
+RUNNING = 'printing'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+class PrintJob:
+    """
+    One printout or PDF export.
+    
+    Features:
+    - Holds its own snapshot of rows, so the table can change while it waits
+    - Targets a printer (by name, '' for the default) or a PDF file
+    - Tracks its state and page progress for the status view
+    """
+    
+    def __init__(self, name, headers, rows, layout, font, printer_name='', pdf_path=None):
+        """
+        Initialize a job.
+        
+        Args:
+            name (str): Label shown in the status view
+            headers (list): Visible column headers
+            rows (list): Rows of visible cell strings
+            layout (PrintLayout): Page formatting
+            font (QFont): Base font
+            printer_name (str): Printer to use when not writing a PDF
+            pdf_path (str): PDF file to write instead of printing
+        """
+        self.name = name
+        self.headers = headers
+        self.rows = rows
+        self.layout = layout
+        self.font = font
+        self.printer_name = printer_name
+        self.pdf_path = pdf_path
+        self.state = WAITING
+        self.pages_done = 0
+        self.page_total = 0
+        self.error = None
+
+    @property
+    def target(self):
+        """Describe where the job goes"""
+        if self.pdf_path:
+            return os.path.basename(self.pdf_path)
+        return self.printer_name or "default printer"
+
+    @property
+    def finished(self):
+        """Whether the job has stopped, successfully or not"""
+        return self.state in (DONE, FAILED, CANCELLED)
+
+    def status_text(self):
+        """Get a one-line summary for the status view"""
+        status = self.state
+        if self.state == RUNNING and self.page_total:
+            status = f"{self.state} page {self.pages_done:,}/{self.page_total:,}"
+        elif self.state == FAILED and self.error:
+            status = f"{self.state}: {self.error}"
+        return f"{self.name} ({len(self.rows):,} rows) → {self.target}: {status}"
+
+def group_positions(keys, positions):
+    """
+    Group row positions by key in one pass.
+    
+    Args:
+        keys (list): Key of every row (e.g. a column's cell text)
+        positions (iterable): Rows to group, in the order they should print
+        
+    Returns:
+        dict: Key -> list of positions, keys in order of first appearance
+    """
+    groups = {}
+    for row in positions:
+        key = keys[row]
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = []
+        group.append(row)
+    return groups
+
+def job_file_name(base, value):
+    """
+    Build a PDF file name for one group.
+    
+    Args:
+        base (str): Common file name start, e.g. "list"
+        value (str): The group's column value
+        
+    Returns:
+        str: File name safe on common file systems
+    """
+    safe = re.sub(r'[^\w.-]+', '_', value).strip('._') or "blank"
+    return f"{base}_{safe}.pdf"
@@ -0,0 +1,302 @@
+"""
+Print formatting for MisterLister.
+Shared by the editor's print/preview and headless batch mode.
+"""
+
+from itertools import islice
+from mister_lister.qt import (
+    QPageSize, QLocale, QPainter, QPen, QColor, QPdfWriter,
+    QFont, QFontMetricsF, QRectF, QPointF, Qt
+)
+from mister_lister.constants import (
+    DEFAULT_FONT_SIZE, DEFAULT_ROW_SPACING,
+    DEFAULT_BORDER_STYLE, DEFAULT_BORDER_GRAY
+)
+
+PDF_RESOLUTION = 1200  # Matches QPrinter.PrinterMode.HighResolution
+CSS_DPI = 96  # Pixels per inch of layout sizes like row spacing
+PAGE_MARGIN_CM = 2  # Margin inside the printable area, as QTextDocument used
+CELL_PADDING_PX = 4
+
+BORDER_STYLES = {
+    'solid': Qt.PenStyle.SolidLine,
+    'dashed': Qt.PenStyle.DashLine,
+    'dotted': Qt.PenStyle.DotLine,
+}
+
+class PrintLayout:
+    """
+    Page formatting used when printing a list.
+    
+    Features:
+    - Font size and row spacing from the editor (or config when headless)
+    - Border style and gray level from print config
+    """
+    
+    def __init__(self, font_size=DEFAULT_FONT_SIZE, spacing=DEFAULT_ROW_SPACING,
+                 border_style=DEFAULT_BORDER_STYLE, border_gray=DEFAULT_BORDER_GRAY):
+        self.font_size = int(font_size)
+        self.spacing = int(spacing)
+        self.border_style = border_style
+        self.border_gray = int(border_gray)
+
+    @classmethod
+    def from_config(cls, config, font_size=None, spacing=None):
+        """
+        Build a layout from print config.
+        
+        Args:
+            config: Config instance
+            font_size: Font size override (defaults to remembered or default size)
+            spacing: Row spacing override (defaults to remembered or default spacing)
+        """
+        if font_size is None or spacing is None:
+            remember = config.get_bool('layout/remember_config')
+            if font_size is None:
+                font_size = config.get_float('layout/font_size') if remember else DEFAULT_FONT_SIZE
+            if spacing is None:
+                spacing = config.get_float('layout/row_spacing') if remember else DEFAULT_ROW_SPACING
+        return cls(
+            font_size, spacing,
+            config.get_str('print/border_style'),
+            config.get_int('print/border_gray')
+        )
+
+def default_page_size():
+    """Get the locale's default paper size, matching QPrinter's choice"""
+    if QLocale().measurementSystem() == QLocale.MeasurementSystem.ImperialUSSystem:
+        return QPageSize(QPageSize.PageSizeId.Letter)
+    return QPageSize(QPageSize.PageSizeId.A4)
+
+def pdf_writer(out_path, page_layout=None):
+    """
+    Create a PDF writer set up like a high-resolution printer.
+    
+    Args:
+        out_path (str): PDF file to write
+        page_layout (QPageLayout): Page setup to copy, e.g. from a QPrinter
+            (the locale's default paper size if None)
+    """
+    writer = QPdfWriter(out_path)
+    writer.setResolution(PDF_RESOLUTION)
+    if page_layout is not None:
+        writer.setPageLayout(page_layout)
+    else:
+        writer.setPageSize(default_page_size())
+    return writer
+
+def page_geometry_key(device):
+    """
+    Get a hashable summary of a device's page setup.
+    
+    Two devices with equal keys lay pages out identically (paper size,
+    orientation, margins and resolution all match).
+    """
+    resolution = device.resolution()
+    page_layout = device.pageLayout()
+    return (
+        resolution,
+        page_layout.fullRectPixels(resolution).getRect(),
+        page_layout.paintRectPixels(resolution).getRect()
+    )
+
+class TablePainter:
+    """
+    Paints a list straight onto a paged device, one page at a time.
+    
+    Features:
+    - Rows per page worked out up front from font metrics, row spacing and margins
+    - Column headers repeated at the top of every page
+    - Equal-width, centered columns and page numbers, matching the
+      earlier HTML table layout
+    - Border style and gray level from the print layout
+    - Laid-out pages are plain lists, so they can be kept and painted again
+    """
+    
+    def __init__(self, device, headers, layout, font):
+        """
+        Work out page geometry for a device.
+        
+        Args:
+            device: QPrinter, QPdfWriter or other paged paint device
+            headers (list): Visible column headers
+            layout (PrintLayout): Page formatting
+            font (QFont): Base font (its size is replaced by layout.font_size)
+        """
+        self.headers = list(headers)
+        dpi_x, dpi_y = device.logicalDpiX(), device.logicalDpiY()
+        px = dpi_y / CSS_DPI  # Device pixels per CSS pixel
+        
+        self.font = QFont(font)
+        self.font.setPointSizeF(layout.font_size)
+        self.header_font = QFont(self.font)
+        self.header_font.setBold(True)
+        metrics = QFontMetricsF(self.font, device)
+        
+        # Page area inside the device's margins, less the 2cm document margin
+        margin_x = PAGE_MARGIN_CM / 2.54 * dpi_x
+        margin_y = PAGE_MARGIN_CM / 2.54 * dpi_y
+        self.page_width = device.width()
+        self.page_height = device.height()
+        self.table_rect = QRectF(
+            margin_x, margin_y,
+            self.page_width - 2 * margin_x,
+            self.page_height - 2 * margin_y
+        )
+        
+        self.padding = CELL_PADDING_PX * px
+        line_height = max(layout.spacing * px, metrics.height())
+        self.row_height = line_height + 2 * self.padding + 2 * px
+        self.column_width = self.table_rect.width() / max(1, len(self.headers))
+        self.rows_per_page = max(1, int(self.table_rect.height() // self.row_height) - 1)
+        
+        gray = layout.border_gray
+        self.pen = QPen(QColor(gray, gray, gray))
+        self.pen.setWidthF(px)
+        self.pen.setStyle(BORDER_STYLES.get(layout.border_style, Qt.PenStyle.SolidLine))
+        self.page_number_pos = QPointF(
+            self.page_width - margin_x,
+            self.page_height - margin_y + metrics.ascent() + 5 * dpi_y / 72
+        )
+        self._metrics = metrics
+        
+        # Text baseline within a row, vertically centered like the HTML cells
+        self._baseline = (self.row_height - metrics.height()) / 2 + metrics.ascent()
+        self._header_cells = self._fit_cells(self.headers, QFontMetricsF(self.header_font, device))
+
+    def pages(self, rows):
+        """
+        Split rows into pages of display-ready text.
+        
+        Cell text is cut to fit its column and positioned here, so
+        laid-out pages can be kept and painted again without re-measuring.
+        
+        Args:
+            rows (iterable): Rows of visible cell strings
+            
+        Yields:
+            list: Rows for each page (one empty page if there are no rows)
+        """
+        rows = iter(rows)
+        page = self._fit_rows(islice(rows, self.rows_per_page))
+        yield page
+        while True:
+            page = self._fit_rows(islice(rows, self.rows_per_page))
+            if not page:
+                return
+            yield page
+
+    def _fit_rows(self, rows):
+        """Cut each cell's text to its column and work out where it's centered"""
+        return [self._fit_cells(row, self._metrics) for row in rows]
+
+    def _fit_cells(self, cells, metrics):
+        """
+        Lay out one row's text.
+        
+        Returns:
+            list: (x, text) pairs, x being where the centered text starts
+        """
+        elide = metrics.elidedText
+        advance = metrics.horizontalAdvance
+        mode = Qt.TextElideMode.ElideRight
+        width = self.column_width - 2 * self.padding
+        left = self.table_rect.left() + self.column_width / 2
+        fitted = []
+        for col, text in enumerate(cells):
+            text = elide(text, mode, width)
+            fitted.append((left + col * self.column_width - advance(text) / 2, text))
+        return fitted
+
+    def page_count(self, row_count):
+        """Get how many pages row_count rows take"""
+        return max(1, -(-row_count // self.rows_per_page))
+
+    def print_pages(self, device, pages, on_page=None):
+        """
+        Paint pages onto a device.
+        
+        Args:
+            device: The printer or PDF writer (with the geometry this was built for)
+            pages (iterable): Page row lists from pages()
+            on_page (callable): Called with the page count after each page;
+                returning False stops printing
+            
+        Returns:
+            int: Pages printed
+        """
+        painter = QPainter()
+        if not painter.begin(device):
+            print("Error starting print: could not open the print device")
+            return 0
+        
+        page_count = 0
+        try:
+            for page_count, page in enumerate(pages, 1):
+                if page_count > 1:
+                    device.newPage()
+                self.paint_page(painter, page, page_count)
+                if on_page is not None and on_page(page_count) is False:
+                    break
+        finally:
+            painter.end()
+        return page_count
+
+    def paint_page(self, painter, rows, page_number):
+        """
+        Paint one page: header row, data rows, grid and page number.
+        
+        Args:
+            painter (QPainter): Active painter on the device
+            rows (list): This page's rows, as returned by pages()
+            page_number (int): 1-based page number
+        """
+        left, top = self.table_rect.left(), self.table_rect.top()
+        width = self.column_width * len(self.headers)
+        height = self.row_height * (len(rows) + 1)
+        
+        painter.setPen(QPen(QColor("black")))
+        painter.setFont(self.header_font)
+        self._paint_cells(painter, self._header_cells, top)
+        painter.setFont(self.font)
+        for i, row in enumerate(rows, 1):
+            self._paint_cells(painter, row, top + i * self.row_height)
+        
+        # Grid lines, drawn once per page rather than once per cell
+        painter.setPen(self.pen)
+        for i in range(len(rows) + 2):
+            y = top + i * self.row_height
+            painter.drawLine(QPointF(left, y), QPointF(left + width, y))
+        for col in range(len(self.headers) + 1):
+            x = left + col * self.column_width
+            painter.drawLine(QPointF(x, top), QPointF(x, top + height))
+        
+        painter.setPen(QPen(QColor("black")))
+        number = str(page_number)
+        painter.drawText(
+            QPointF(self.page_number_pos.x() - self._metrics.horizontalAdvance(number), self.page_number_pos.y()),
+            number
+        )
+
+    def _paint_cells(self, painter, cells, top):
+        """Paint one row's laid-out text"""
+        baseline = top + self._baseline
+        for x, text in cells:
+            painter.drawText(QPointF(x, baseline), text)
+
+def print_rows(device, headers, rows, layout, font):
+    """
+    Print rows to a printer or other paged paint device.
+    
+    Args:
+        device: QPrinter or QPdfWriter
+        headers (list): Visible column headers
+        rows (iterable): Rows of visible cell strings
+        layout (PrintLayout): Page formatting
+        font (QFont): Base font
+        
+    Returns:
+        int: Pages printed
+    """
+    table = TablePainter(device, headers, layout, font)
+    return table.print_pages(device, table.pages(rows))
@@ -7,11 +7,12 @@ Provides organized access to Qt components.
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QFileDialog,
+    QTableWidget, QTableWidgetItem, QTableView, QFileDialog,
     QMenu, QHeaderView, QPushButton, QFrame,
     QSizePolicy, QDialog, QGroupBox, QCheckBox,
     QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox,
-    QColorDialog, QSlider, QButtonGroup
+    QColorDialog, QSlider, QButtonGroup, QProgressBar,
+    QAbstractItemView, QListWidget
 )
 
 # GUI Components
@@ -19,19 +20,30 @@ from PyQt6.QtGui import (
     QDragEnterEvent, QDropEvent, QAction, QPainter,
     QColor, QPalette, QFont, QIcon, QTextDocument,
     QPainterPath, QPen, QFontDatabase, QTextCursor,
-    QPageLayout, QIntValidator
+    QPageLayout, QIntValidator, QGuiApplication,
+    QPdfWriter, QPageSize, QFontMetrics, QFontMetricsF,
+    QPixmap, QImage
 )
 
 # Core Qt
 from PyQt6.QtCore import (
     Qt, QSettings, QSize, QTimer, QRectF,
-    QMarginsF
+    QMarginsF, QPointF, QLocale, QThread, QObject, pyqtSignal,
+    QAbstractTableModel, QAbstractProxyModel, QModelIndex,
+    QMimeData, QRect, QEvent
 )
 
-# Print Support
-from PyQt6.QtPrintSupport import (
-    QPrinter, QPrintPreviewDialog, QPrinterInfo
-)
+# Print Support (imported on first use, it isn't needed for the first frame)
+PRINT_SUPPORT = ('QPrinter', 'QPrintPreviewDialog', 'QPrinterInfo')
+
+def __getattr__(name):
+    """Import QtPrintSupport classes the first time one is asked for"""
+    if name in PRINT_SUPPORT:
+        from PyQt6 import QtPrintSupport
+        for print_name in PRINT_SUPPORT:
+            globals()[print_name] = getattr(QtPrintSupport, print_name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Re-export commonly used classes
 __all__ = [
@@ -49,5 +61,11 @@ __all__ = [
     'QCheckBox', 'QSpinBox', 'QDoubleSpinBox',
     'QLineEdit', 'QComboBox', 'QColorDialog',
     'QPrinterInfo', 'QSlider', 'QButtonGroup',
-    'QIntValidator'
+    'QIntValidator', 'QGuiApplication', 'QPdfWriter',
+    'QPageSize', 'QLocale', 'QProgressBar', 'QThread',
+    'QObject', 'pyqtSignal', 'QTableView', 'QAbstractItemView',
+    'QAbstractTableModel', 'QAbstractProxyModel', 'QModelIndex',
+    'QFontMetrics', 'QFontMetricsF', 'QMimeData', 'QPointF',
+    'QPixmap', 'QImage', 'QRect', 'QEvent',
+    'QListWidget'
 ] 
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Startup timing for MisterLister.
+Records where launch time goes when run with --profile-startup.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from mister_lister.qt import QObject, QEvent, QTimer
+
+class StartupProfile:
+    """
+    Wall-clock timings of the phases of startup.
+    
+    Features:
+    - Phases are timed with a context manager or from a saved start time
+    - Does nothing until enabled, so timing points can stay in the code
+    - Time between timed phases is reported as untimed, so nothing hides
+    - Optional checks run after first paint (e.g. restyle cost), reported apart
+    - Prints a breakdown slowest first, or writes it as JSON
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.phases = []  # (name, start offset, seconds)
+        self.checks = []  # (name, seconds), measured after startup
+
+    def enable(self, started=None):
+        """
+        Start recording phases.
+        
+        Args:
+            started (float): perf_counter() value startup began at (defaults to now)
+        """
+        self.enabled = True
+        self.started = time.perf_counter() if started is None else started
+        self.phases = []
+        self.checks = []
+
+    def record(self, name, start, end=None):
+        """
+        Record a phase that ran from start to end (or now).
+        
+        Args:
+            name (str): Phase name
+            start (float): perf_counter() value the phase began at
+            end (float): perf_counter() value the phase ended at
+        """
+        if self.enabled:
+            end = time.perf_counter() if end is None else end
+            self.phases.append((name, start - self.started, end - start))
+
+    @contextmanager
+    def phase(self, name):
+        """Time the code in a with block as one phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def total(self):
+        """Seconds from startup to the end of the last recorded phase"""
+        return max((offset + seconds for _, offset, seconds in self.phases), default=0.0)
+
+    def breakdown(self):
+        """
+        Get the recorded phases, slowest first.
+        
+        Returns:
+            list: (name, start offset, seconds) tuples, including an
+                "(untimed)" entry for time between the recorded phases
+        """
+        phases = list(self.phases)
+        untimed = self.total() - sum(seconds for _, _, seconds in phases)
+        if untimed > 0:
+            phases.append(("(untimed)", None, untimed))
+        return sorted(phases, key=lambda phase: phase[2], reverse=True)
+
+    def report(self, json_path=None):
+        """
+        Print the breakdown, or write it to a JSON file.
+        
+        Args:
+            json_path (str): File to write instead of printing
+        """
+        total = self.total()
+        phases = self.breakdown()
+        if json_path:
+            try:
+                with open(json_path, 'w') as f:
+                    json.dump({
+                        'total_seconds': total,
+                        'phases': [
+                            {'name': name, 'start_seconds': offset, 'seconds': seconds}
+                            for name, offset, seconds in phases
+                        ],
+                        'checks': [
+                            {'name': name, 'seconds': seconds}
+                            for name, seconds in self.checks
+                        ],
+                    }, f, indent=4)
+                print(f"Wrote startup profile to {json_path}")
+            except OSError as e:
+                print(f"Error writing startup profile: {e}")
+            return
+        
+        print(f"Startup took {total * 1000:.0f} ms")
+        width = max(len(name) for name, _, _ in phases)
+        for name, _, seconds in phases:
+            share = seconds / total * 100 if total else 0
+            print(f"  {name:<{width}}  {seconds * 1000:8.1f} ms  {share:5.1f}%")
+        if self.checks:
+            print("After startup (not in the total):")
+            width = max(len(name) for name, _ in self.checks)
+            for name, seconds in self.checks:
+                print(f"  {name:<{width}}  {seconds * 1000:8.1f} ms")
+
+    def report_after_first_paint(self, window, json_path=None, checks=None):
+        """
+        Record the time from now until the window first paints, then report.
+        
+        Args:
+            window (QWidget): Window about to be shown
+            json_path (str): File to write instead of printing
+            checks (dict): Name -> callable returning seconds, run after
+                first paint and reported separately from startup phases
+        """
+        if self.enabled:
+            watcher = FirstPaintWatcher(self, json_path, window, checks or {})
+            window.installEventFilter(watcher)
+
+class FirstPaintWatcher(QObject):
+    """Event filter that finishes a startup profile once its window has painted"""
+    
+    def __init__(self, profile, json_path, window, checks):
+        super().__init__(window)
+        self.profile = profile
+        self.json_path = json_path
+        self.checks = checks
+        self.shown = time.perf_counter()
+
+    def eventFilter(self, obj, event):
+        """Wait for the window's first paint event"""
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # Children paint in the same pass; report once it's done
+            QTimer.singleShot(0, self.finish)
+        return False
+
+    def finish(self):
+        """Record first paint, run the checks and report"""
+        self.profile.record("first paint", self.shown)
+        for name, check in self.checks.items():
+            self.profile.checks.append((name, check()))
+        self.profile.report(self.json_path)
+        self.deleteLater()
+
+# Shared by main() and FileEditor.__init__
+startup_profile = StartupProfile()
@@ -3,15 +3,14 @@ Bottom bar component containing application controls.
 """
 
 from mister_lister.qt import (
-    QFrame, QHBoxLayout, QWidget
+    QFrame, QHBoxLayout, QWidget, QProgressBar, QLineEdit
 )
 from mister_lister.constants import (
     NORMAL_TAN, DARKER_TAN, INACTIVE_TAN, 
-    HOVER_TAN, LIGHT_BLUE
+    HOVER_TAN, LIGHT_BLUE, WHITE
 )
 from mister_lister.ui.widgets.buttons import CircleButton
 from mister_lister.ui.widgets.groups import ButtonGroup
-from pytablericons import OutlineIcon
 
 class BottomBar(QFrame):
     """
@@ -22,7 +21,7 @@ class BottomBar(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setStyleSheet(f"""
-            QFrame {{
+            BottomBar {{
                 background-color: {NORMAL_TAN};
                 border-top: 1px solid {DARKER_TAN};
             }}
@@ -36,22 +35,69 @@ class BottomBar(QFrame):
         main_layout.setContentsMargins(20, 5, 20, 5)
         
         # Initialize buttons with consistent naming and initial states
-        self.add_files_btn = CircleButton(OutlineIcon.FOLDER)
+        self.add_files_btn = CircleButton("FOLDER")
         self.add_files_btn.interactive = True  # Should be interactive by default
         
-        self.font_minus_btn = CircleButton(OutlineIcon.MINUS)
-        self.font_plus_btn = CircleButton(OutlineIcon.PLUS)
-        self.spacing_minus_btn = CircleButton(OutlineIcon.MINUS)
-        self.spacing_plus_btn = CircleButton(OutlineIcon.PLUS)
-        self.preview_btn = CircleButton(OutlineIcon.EYE)
-        self.print_btn = CircleButton(OutlineIcon.PRINTER)
-        self.clear_btn = CircleButton(OutlineIcon.TRASH)
-        self.config_btn = CircleButton(OutlineIcon.SETTINGS)
+        self.font_minus_btn = CircleButton("MINUS")
+        self.font_plus_btn = CircleButton("PLUS")
+        self.spacing_minus_btn = CircleButton("MINUS")
+        self.spacing_plus_btn = CircleButton("PLUS")
+        self.preview_btn = CircleButton("EYE")
+        self.print_btn = CircleButton("PRINTER")
+        self.clear_btn = CircleButton("TRASH")
+        self.config_btn = CircleButton("SETTINGS")
+        self.cancel_import_btn = CircleButton("X")
+        self.cancel_import_btn.interactive = True
+        self.jobs_btn = CircleButton("LIST")
+        self.jobs_btn.interactive = True
+        self.cancel_jobs_btn = CircleButton("X")
+        self.cancel_jobs_btn.interactive = True
+        
+        # Import and print job progress (shown only while running)
+        self.import_progress = self._create_progress_bar()
+        self.jobs_progress = self._create_progress_bar()
+        
+        # Filter box (shows only rows containing its text)
+        self.filter_box = QLineEdit()
+        self.filter_box.setPlaceholderText("search")
+        self.filter_box.setClearButtonEnabled(True)
+        self.filter_box.setFixedSize(160, 30)
+        self.filter_box.setStyleSheet(f"""
+            QLineEdit {{
+                background-color: {WHITE};
+                border: none;
+                border-radius: 15px;
+                padding: 0px 10px;
+                color: black;
+            }}
+            QLineEdit:disabled {{
+                background-color: {INACTIVE_TAN};
+            }}
+        """)
         
         # Add Files Group
         self.add_files_group = ButtonGroup("add files")
         self.add_files_group.layout.addWidget(self.add_files_btn)
         
+        # Import Progress Group
+        self.import_group = ButtonGroup("importing")
+        self.import_group.layout.addWidget(self.import_progress)
+        self.import_group.layout.addWidget(self.cancel_import_btn)
+        self.import_group.set_active(True)
+        self.import_group.setVisible(False)
+        
+        # Print Jobs Progress Group
+        self.jobs_group = ButtonGroup("printing")
+        self.jobs_group.layout.addWidget(self.jobs_progress)
+        self.jobs_group.layout.addWidget(self.jobs_btn)
+        self.jobs_group.layout.addWidget(self.cancel_jobs_btn)
+        self.jobs_group.set_active(True)
+        self.jobs_group.setVisible(False)
+        
+        # Filter Group
+        self.filter_group = ButtonGroup("filter")
+        self.filter_group.layout.addWidget(self.filter_box)
+        
         # Font Size Group
         self.font_group = ButtonGroup("font size")
         self.font_group.layout.addWidget(self.font_minus_btn)
@@ -74,12 +120,16 @@ class BottomBar(QFrame):
         
         # Add all groups to main layout
         main_layout.addWidget(self.add_files_group)
+        main_layout.addWidget(self.import_group)
+        main_layout.addStretch(1)
+        main_layout.addWidget(self.filter_group)
         main_layout.addStretch(1)
         main_layout.addWidget(self.font_group)
         main_layout.addStretch(1)
         main_layout.addWidget(self.spacing_group)
         main_layout.addStretch(1)
         main_layout.addWidget(self.actions_group)
+        main_layout.addWidget(self.jobs_group)
         main_layout.addStretch(1)
         main_layout.addWidget(self.config_group)
         
@@ -93,6 +143,9 @@ class BottomBar(QFrame):
         self.print_btn.setToolTip("Print Filenames")
         self.clear_btn.setToolTip("Clear Filenames")
         self.config_btn.setToolTip("Configuration")
+        self.cancel_import_btn.setToolTip("Stop Adding Files")
+        self.jobs_btn.setToolTip("Show Print Jobs")
+        self.cancel_jobs_btn.setToolTip("Stop Print Jobs")
         
         # Set initial active states
         self.add_files_group.set_active(True)
@@ -105,6 +158,8 @@ class BottomBar(QFrame):
     def set_controls_enabled(self, enabled):
         """Enable or disable control buttons and their groups"""
         # Update group states
+        self.filter_group.set_active(enabled)
+        self.filter_box.setEnabled(enabled)
         self.font_group.set_active(enabled)
         self.spacing_group.set_active(enabled)
         self.actions_group.set_active(enabled)
@@ -123,11 +178,92 @@ class BottomBar(QFrame):
             btn.in_use = False  # Reset in_use state when disabling
             btn.update_style()
             
+    def show_progress(self, done, total=0):
+        """
+        Show import progress next to the add files button.
+        
+        Args:
+            done (int): Files parsed so far
+            total (int): Total files, or 0 when still discovering files
+        """
+        if total:
+            self.import_progress.setRange(0, total)
+            self.import_progress.setValue(min(done, total))
+        else:
+            self.import_progress.setRange(0, 0)  # Busy indicator
+        self.import_group.label_widget.setText(f"importing {done:,}")
+        self.import_group.setVisible(True)
+
+    def hide_progress(self):
+        """Hide import progress"""
+        self.import_group.setVisible(False)
+        self.import_group.label_widget.setText("importing")
+
+    def show_job_progress(self, jobs_done, job_count, pages_done=0, page_total=0):
+        """
+        Show print job progress next to the action buttons.
+        
+        Args:
+            jobs_done (int): Jobs finished so far
+            job_count (int): Jobs in the batch
+            pages_done (int): Pages finished in the running job
+            page_total (int): Pages in the running job (0 if not known yet)
+        """
+        if page_total:
+            self.jobs_progress.setRange(0, page_total)
+            self.jobs_progress.setValue(min(pages_done, page_total))
+        else:
+            self.jobs_progress.setRange(0, 0)  # Busy indicator
+        self.jobs_group.label_widget.setText(f"printing {min(jobs_done + 1, job_count)}/{job_count}")
+        self.jobs_group.setVisible(True)
+
+    def hide_job_progress(self):
+        """Hide print job progress"""
+        self.jobs_group.setVisible(False)
+        self.jobs_group.label_widget.setText("printing")
+
+    def show_filter_count(self, shown, total):
+        """
+        Show how many rows the filter lets through.
+        
+        Args:
+            shown (int): Rows matching the filter
+            total (int): Rows in the table
+        """
+        self.filter_group.label_widget.setText(f"filter {shown:,} of {total:,}")
+
+    def hide_filter_count(self):
+        """Reset the filter label"""
+        self.filter_group.label_widget.setText("filter")
+
+    def prewarm_icons(self):
+        """Render every hover/in-use/disabled icon look so state changes never wait"""
+        for button in self.findChildren(CircleButton):
+            button.prewarm_icons()
+
     def set_add_files_icon_state(self, has_files):
         """Update add files button icon based on whether files are loaded"""
         self.add_files_btn.in_use = has_files
         self.add_files_btn.update_style()
 
+    def _create_progress_bar(self):
+        """Create a small progress bar styled for the bar"""
+        progress = QProgressBar()
+        progress.setFixedSize(140, 12)
+        progress.setTextVisible(False)
+        progress.setStyleSheet(f"""
+            QProgressBar {{
+                background-color: {INACTIVE_TAN};
+                border: none;
+                border-radius: 6px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {LIGHT_BLUE};
+                border-radius: 6px;
+            }}
+        """)
+        return progress
+
     def _get_button_stylesheet(self, interactive=True):
         """Get consistent button styling"""
         return f"""
@@ -3,5 +3,7 @@ Dialog components for MisterLister.
 """
 from .config_dialog import ConfigDialog
 from .confirm_dialog import ConfirmDialog
+from .batch_print_dialog import BatchPrintDialog
+from .job_queue_dialog import JobQueueDialog
 
-__all__ = ['ConfigDialog', 'ConfirmDialog'] 
\ No newline at end of file
+__all__ = ['ConfigDialog', 'ConfirmDialog', 'BatchPrintDialog', 'JobQueueDialog']
@@ -0,0 +1,118 @@
+"""
+Batch print dialog for MisterLister.
+Sets up a batch of print jobs, optionally one per distinct column value.
+"""
+
+from mister_lister.qt import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QComboBox
+)
+from mister_lister.constants import (
+    WHITE, NORMAL_TAN, HOVER_TAN,
+    LIGHT_BLUE, DARKER_TAN
+)
+
+DIALOG_STYLE = f"""
+    QDialog {{
+        background-color: {WHITE};
+    }}
+    QPushButton {{
+        background-color: {NORMAL_TAN};
+        border: none;
+        border-radius: 15px;
+        padding: 8px 16px;
+        color: {DARKER_TAN};
+        font-family: 'Asap';
+        font-weight: bold;
+        font-size: 13px;
+    }}
+    QPushButton:hover {{
+        background-color: {HOVER_TAN};
+        color: {WHITE};
+    }}
+    QPushButton:pressed {{
+        background-color: {LIGHT_BLUE};
+        color: {WHITE};
+    }}
+    QLabel {{
+        color: {DARKER_TAN};
+        font-family: 'Asap';
+        font-size: 14px;
+    }}
+    QComboBox, QListWidget {{
+        border: 1px solid {NORMAL_TAN};
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: {DARKER_TAN};
+        font-family: 'Asap';
+        background: {WHITE};
+    }}
+"""
+
+class BatchPrintDialog(QDialog):
+    """
+    Dialog for starting a batch of print jobs.
+    
+    Features:
+    - Split by any column: one job per distinct value (e.g. per date)
+    - Send the batch to the configured printer or to one PDF per job
+    """
+    
+    def __init__(self, headers, printer_name='', parent=None):
+        """
+        Initialize dialog.
+        
+        Args:
+            headers (list): Column headers to offer for splitting
+            printer_name (str): Configured printer ('' for the default)
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Batch Print")
+        self.setStyleSheet(DIALOG_STYLE)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Split column
+        split_row = QHBoxLayout()
+        split_row.addWidget(QLabel("one job per"))
+        self.split_combo = QComboBox()
+        self.split_combo.addItem("whole list (no split)")
+        self.split_combo.addItems(headers)
+        split_row.addWidget(self.split_combo, 1)
+        layout.addLayout(split_row)
+        
+        # Target
+        target_row = QHBoxLayout()
+        target_row.addWidget(QLabel("send to"))
+        self.target_combo = QComboBox()
+        self.target_combo.addItem(f"printer: {printer_name or 'default'}")
+        self.target_combo.addItem("PDF files in a folder...")
+        target_row.addWidget(self.target_combo, 1)
+        layout.addLayout(target_row)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        start_btn = QPushButton("Start")
+        start_btn.clicked.connect(self.accept)
+        button_layout.addWidget(start_btn)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+        
+        self.setMinimumWidth(380)
+
+    @property
+    def split_column(self):
+        """Column to split by, or None for a single job"""
+        index = self.split_combo.currentIndex()
+        return index - 1 if index > 0 else None
+
+    @property
+    def to_pdf(self):
+        """Whether jobs should be written as PDFs instead of printed"""
+        return self.target_combo.currentIndex() == 1
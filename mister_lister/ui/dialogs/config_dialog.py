@@ -8,6 +8,7 @@ from mister_lister.qt import (
 )
 from mister_lister.constants import WHITE, NORMAL_TAN, HOVER_TAN, LIGHT_BLUE, DARKER_TAN
 from mister_lister.utils.config import Config
+from mister_lister.ui.styles import BUTTON_STYLESHEET
 from .config_groups import (
     PrintConfigGroup, FileConfigGroup,
     FormatConfigGroup, StartupConfigGroup
@@ -196,7 +197,7 @@ class ConfigDialog(QDialog):
             QSlider::handle:horizontal:hover {{
                 background: {HOVER_TAN};
             }}
-        """
+        """ + BUTTON_STYLESHEET  # Icon buttons must win over the QPushButton rule above
 
     def save_and_close(self):
         """Save all configuration values and close"""
@@ -13,7 +13,6 @@ from mister_lister.constants import (
     DEFAULT_FONT_SIZE, DEFAULT_ROW_SPACING
 )
 from mister_lister.ui.widgets.buttons import SmallIconButton
-from pytablericons import OutlineIcon
 import os
 
 class ConfigGroup(QGroupBox):
@@ -184,7 +183,7 @@ class FileConfigGroup(ConfigGroup):
             }
         """)
         self.default_dir = QLineEdit()
-        self.default_browse = SmallIconButton(OutlineIcon.FOLDER)
+        self.default_browse = SmallIconButton("FOLDER")
         self.default_browse.set_interactive(True)
         self.default_browse.clicked.connect(lambda: self.choose_directory('default'))
         
@@ -203,7 +202,7 @@ class FileConfigGroup(ConfigGroup):
             }
         """)
         self.backup_dir = QLineEdit()
-        self.backup_browse = SmallIconButton(OutlineIcon.FOLDER)
+        self.backup_browse = SmallIconButton("FOLDER")
         self.backup_browse.set_interactive(True)
         self.backup_browse.clicked.connect(lambda: self.choose_directory('backup'))
         
@@ -255,7 +254,7 @@ class FormatConfigGroup(ConfigGroup):
         font_label.setFixedWidth(100)
         
         # Add minus button
-        self.font_minus = SmallIconButton(OutlineIcon.MINUS)
+        self.font_minus = SmallIconButton("MINUS")
         self.font_minus.set_interactive(True)
         self.font_minus.clicked.connect(lambda: self.adjust_value(self.font_size, -1))
         font_layout.addWidget(font_label)
@@ -269,7 +268,7 @@ class FormatConfigGroup(ConfigGroup):
         font_layout.addWidget(self.font_size)
         
         # Add plus button
-        self.font_plus = SmallIconButton(OutlineIcon.PLUS)
+        self.font_plus = SmallIconButton("PLUS")
         self.font_plus.set_interactive(True)
         self.font_plus.clicked.connect(lambda: self.adjust_value(self.font_size, 1))
         font_layout.addWidget(self.font_plus)
@@ -284,7 +283,7 @@ class FormatConfigGroup(ConfigGroup):
         row_label.setFixedWidth(100)
         
         # Add minus button
-        self.row_minus = SmallIconButton(OutlineIcon.MINUS)
+        self.row_minus = SmallIconButton("MINUS")
         self.row_minus.set_interactive(True)
         self.row_minus.clicked.connect(lambda: self.adjust_value(self.row_height, -2))
         row_layout.addWidget(row_label)
@@ -298,7 +297,7 @@ class FormatConfigGroup(ConfigGroup):
         row_layout.addWidget(self.row_height)
         
         # Add plus button
-        self.row_plus = SmallIconButton(OutlineIcon.PLUS)
+        self.row_plus = SmallIconButton("PLUS")
         self.row_plus.set_interactive(True)
         self.row_plus.clicked.connect(lambda: self.adjust_value(self.row_height, 2))
         row_layout.addWidget(self.row_plus)
@@ -11,6 +11,7 @@ from mister_lister.constants import (
     WHITE, NORMAL_TAN, HOVER_TAN, 
     LIGHT_BLUE, DARKER_TAN
 )
+from mister_lister.fonts import register_fonts
 
 class ConfirmDialog(QDialog):
     """
@@ -22,6 +23,7 @@ class ConfirmDialog(QDialog):
         """Initialize confirmation dialog"""
         super().__init__(parent)
         self.setWindowTitle("Clear Table?")
+        register_fonts("Medium")  # Message text weight, not needed at startup
         
         # Set dialog styling
         self.setStyleSheet(f"""
@@ -0,0 +1,68 @@
+"""
+Print job status dialog for MisterLister.
+Lists queued, running and finished print jobs.
+"""
+
+from mister_lister.qt import (
+    QDialog, QVBoxLayout, QHBoxLayout,
+    QPushButton, QListWidget
+)
+from .batch_print_dialog import DIALOG_STYLE
+
+class JobQueueDialog(QDialog):
+    """
+    Status view for the print queue.
+    
+    Features:
+    - One line per job with its target, state and page progress
+    - Updates live as the queue runs; stays open while you keep working
+    """
+    
+    def __init__(self, queue, parent=None):
+        """
+        Initialize dialog.
+        
+        Args:
+            queue (PrintQueue): Queue to show
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Print Jobs")
+        self.setStyleSheet(DIALOG_STYLE)
+        self.queue = queue
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(15, 15, 15, 15)
+        
+        self.job_list = QListWidget()
+        layout.addWidget(self.job_list)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.cancel_btn = QPushButton("Stop All")
+        self.cancel_btn.clicked.connect(queue.cancel)
+        button_layout.addWidget(self.cancel_btn)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        
+        queue.changed.connect(self.refresh)
+        self.refresh()
+        self.resize(520, 320)
+
+    def refresh(self):
+        """Update the job lines from the queue"""
+        jobs = self.queue.jobs
+        while self.job_list.count() > len(jobs):
+            self.job_list.takeItem(self.job_list.count() - 1)
+        for i, job in enumerate(jobs):
+            text = job.status_text()
+            if i < self.job_list.count():
+                item = self.job_list.item(i)
+                if item.text() != text:
+                    item.setText(text)
+            else:
+                self.job_list.addItem(text)
+        self.cancel_btn.setEnabled(self.queue.busy)
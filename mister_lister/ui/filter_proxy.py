@@ -0,0 +1,229 @@
+"""
+Filter proxy for MisterLister.
+Shows the subset of table rows matching a search, without copying them.
+"""
+
+from bisect import bisect_left
+from mister_lister.qt import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+
+class FilterProxyModel(QAbstractProxyModel):
+    """
+    Row filter over a ListTableModel.
+    
+    Features:
+    - Passes every row through untouched while no filter is set
+    - Keeps matching source rows as a sorted list, so mapping is a list
+      lookup one way and a binary search the other
+    - Follows appends, removals, edits and sorts of the source model
+      incrementally instead of re-filtering everything
+    - Selections and the current cell follow their rows when the source sorts
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.query = ""
+        self._rows = None  # Matching source rows in order, or None when unfiltered
+        self._pending_removal = None
+        self._saved_persistent = None
+        self._saved_ids = None
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.rowsAboutToBeInserted.connect(self._source_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._source_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._source_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._source_rows_removed)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._source_reset)
+        model.layoutAboutToBeChanged.connect(self._source_layout_about_to_change)
+        model.layoutChanged.connect(self._source_layout_changed)
+        model.dataChanged.connect(self._source_data_changed)
+        model.headerDataChanged.connect(self.headerDataChanged)
+
+    # Filtering
+    @property
+    def filtered(self):
+        """True while a filter is hiding rows"""
+        return self._rows is not None
+
+    def set_filter(self, query, row_ids=None):
+        """
+        Show only rows containing the query.
+        
+        Args:
+            query (str): Search text; empty shows every row
+            row_ids (set): Ids of the matching rows, e.g. from a TrigramIndex
+        """
+        source = self.sourceModel()
+        self.beginResetModel()
+        self.query = query.casefold()
+        if not self.query:
+            self._rows = None
+        elif row_ids is None:
+            self._rows = [row for row in range(source.rowCount()) if self._matches(row)]
+        else:
+            positions = (source.position_of(row_id) for row_id in row_ids)
+            self._rows = sorted(row for row in positions if row >= 0)
+        self.endResetModel()
+
+    def clear_filter(self):
+        """Show every row"""
+        self.set_filter("")
+
+    def _matches(self, source_row):
+        """Check one source row against the query"""
+        return any(self.query in value.casefold() for value in self.sourceModel().row_values(source_row))
+
+    def source_row(self, row):
+        """Get the source row shown at a proxy row"""
+        return row if self._rows is None else self._rows[row]
+
+    def source_rows(self):
+        """Get the shown source rows, in display order"""
+        if self._rows is None:
+            return range(self.sourceModel().rowCount())
+        return list(self._rows)
+
+    # Qt proxy interface
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.sourceModel().rowCount() if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self.source_row(proxy_index.row()), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._rows is not None:
+            pos = bisect_left(self._rows, row)
+            if pos == len(self._rows) or self._rows[pos] != row:
+                return QModelIndex()
+            row = pos
+        return self.index(row, source_index.column())
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.sourceModel().cell(self.source_row(index.row()), index.column())
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        return self.sourceModel().setData(self.mapToSource(index), value, role)
+
+    def flags(self, index):
+        return self.sourceModel().flags(self.mapToSource(index))
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Vertical and role == Qt.ItemDataRole.DisplayRole:
+            return section + 1
+        return self.sourceModel().headerData(section, orientation, role)
+
+    # Source model changes
+    def _source_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _source_rows_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+            return
+        
+        # Shift rows below the insertion, then add the new rows that match
+        count = last - first + 1
+        pos = bisect_left(self._rows, first)
+        for i in range(pos, len(self._rows)):
+            self._rows[i] += count
+        matches = [row for row in range(first, last + 1) if self._matches(row)]
+        if matches:
+            self.beginInsertRows(QModelIndex(), pos, pos + len(matches) - 1)
+            self._rows[pos:pos] = matches
+            self.endInsertRows()
+
+    def _source_rows_about_to_be_removed(self, parent, first, last):
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            return
+        start = bisect_left(self._rows, first)
+        end = bisect_left(self._rows, last + 1)
+        self._pending_removal = (start, end)
+        if end > start:
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+
+    def _source_rows_removed(self, parent, first, last):
+        if self._rows is None:
+            self.endRemoveRows()
+            return
+        start, end = self._pending_removal
+        self._pending_removal = None
+        count = last - first + 1
+        self._rows[start:] = [row - count for row in self._rows[end:]]
+        if end > start:
+            self.endRemoveRows()
+
+    def _source_reset(self):
+        if self._rows is not None:
+            self._rows = [row for row in range(self.sourceModel().rowCount()) if self._matches(row)]
+        self.endResetModel()
+
+    def _source_layout_about_to_change(self, parents=(), hint=None):
+        self.layoutAboutToBeChanged.emit([], QAbstractTableModel.LayoutChangeHint.VerticalSortHint)
+        # Remember persistent indexes by row id so they can follow their rows
+        source = self.sourceModel()
+        if self._rows is not None:
+            self._saved_ids = [source.row_id(row) for row in self._rows]
+        self._saved_persistent = [
+            (index, source.row_id(self.source_row(index.row())), index.column())
+            for index in self.persistentIndexList()
+        ]
+
+    def _source_layout_changed(self, parents=(), hint=None):
+        source = self.sourceModel()
+        if self._rows is not None:
+            self._rows = sorted(source.position_of(row_id) for row_id in self._saved_ids)
+            self._saved_ids = None
+        
+        saved = self._saved_persistent or []
+        self._saved_persistent = None
+        if saved:
+            old_indexes = [index for index, _, _ in saved]
+            new_indexes = []
+            for _, row_id, column in saved:
+                source_index = source.index(source.position_of(row_id), column)
+                new_indexes.append(self.mapFromSource(source_index))
+            self.changePersistentIndexList(old_indexes, new_indexes)
+        
+        self.layoutChanged.emit([], QAbstractTableModel.LayoutChangeHint.VerticalSortHint)
+
+    def _source_data_changed(self, top_left, bottom_right, roles=()):
+        if self._rows is None:
+            self.dataChanged.emit(
+                self.index(top_left.row(), top_left.column()),
+                self.index(bottom_right.row(), bottom_right.column()),
+                roles
+            )
+            return
+        
+        # Edited rows stay visible until the filter changes
+        start = bisect_left(self._rows, top_left.row())
+        end = bisect_left(self._rows, bottom_right.row() + 1)
+        if end > start:
+            self.dataChanged.emit(
+                self.index(start, top_left.column()),
+                self.index(end - 1, bottom_right.column()),
+                roles
+            )
@@ -0,0 +1,104 @@
+"""
+Shared stylesheet for MisterLister.
+State-dependent widgets are styled through dynamic properties, so a state
+change is a cheap re-polish instead of parsing a new stylesheet.
+"""
+
+import time
+from mister_lister.qt import QApplication, Qt
+from mister_lister.constants import (
+    DARKER_TAN, INACTIVE_TAN, HOVER_TAN, LIGHT_BLUE
+)
+
+# Icon buttons and button group labels. Interactive buttons carry
+# interactive="true"; active group labels carry active="true".
+BUTTON_STYLESHEET = f"""
+    CircleButton {{
+        background: transparent;
+        border: none;
+        border-radius: 30px;
+        padding: 0px;
+    }}
+    CircleButton:hover, CircleButton:pressed, CircleButton:disabled {{
+        background: transparent;
+    }}
+    CircleButton[interactive="true"]:hover {{
+        background: {HOVER_TAN};
+    }}
+    CircleButton[interactive="true"]:pressed {{
+        background: {LIGHT_BLUE};
+    }}
+    SmallIconButton {{
+        border-radius: 12px;
+    }}
+    SmallIconButton:disabled {{
+        color: {INACTIVE_TAN};
+    }}
+    ButtonGroup {{
+        border: none;
+        background: transparent;
+    }}
+    ButtonGroup QLabel {{
+        color: {INACTIVE_TAN};
+        font-family: 'Asap';
+        font-weight: bold;
+        font-size: 14px;
+        margin-top: 0px;
+        border: none;
+        background: transparent;
+    }}
+    ButtonGroup QLabel[active="true"] {{
+        color: {DARKER_TAN};
+    }}
+"""
+
+def apply_app_style(app):
+    """Install the shared stylesheet on the application"""
+    app.setStyleSheet(BUTTON_STYLESHEET)
+
+def set_style_property(widget, name, value):
+    """
+    Set a dynamic property the stylesheet switches on and re-polish the widget.
+    
+    Args:
+        widget (QWidget): Widget to update
+        name (str): Property name used in the stylesheet
+        value: New property value
+        
+    Returns:
+        bool: True if the property changed
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    
+    # Widgets not polished yet pick the property up when they first are
+    if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    widget.update()
+    return True
+
+def time_state_changes(widget, set_state, initial=False, rounds=50):
+    """
+    Time a widget's restyle by toggling its state back and forth.
+    Used by --profile-startup; works with any implementation of the state
+    setter, so the same call measures the cost before and after a styling change.
+    
+    Args:
+        widget (QWidget): Widget (or container) being restyled
+        set_state (callable): Called with True/False to flip the state
+        initial (bool): Current state, which the widget is left in
+        rounds (int): Number of flips (rounded up to an even number)
+        
+    Returns:
+        float: Average seconds per flip, including the repaint
+    """
+    rounds += rounds % 2
+    started = time.perf_counter()
+    for i in range(rounds):
+        set_state(initial if i % 2 else not initial)
+        widget.repaint()
+        QApplication.processEvents()
+    return (time.perf_counter() - started) / rounds
@@ -0,0 +1,311 @@
+"""
+Table model for MisterLister.
+Stores the list column by column and serves cells to a QTableView on demand.
+"""
+
+from contextlib import contextmanager
+from itertools import count
+from mister_lister.qt import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from mister_lister.utils.sort_keys import text_key, sort_permutation
+
+class ListTableModel(QAbstractTableModel):
+    """
+    Columnar table model backed by one Python list per column.
+    
+    Features:
+    - No per-cell objects; cells are plain strings served through data()
+    - Each row keeps its source path and a stable row id
+    - Typed sort keys computed once per cell as rows arrive
+    - Stable multi-column sorting by a single permutation applied to every column
+    - Editable cells, like the QTableWidget it replaces
+    """
+    
+    # Emitted with the ids of rows whose text changed (edits and replacements)
+    rows_edited = pyqtSignal(list)
+    
+    def __init__(self, headers=None, key_functions=None, parent=None):
+        """
+        Initialize an empty model.
+        
+        Args:
+            headers (list): Column headers
+            key_functions (list): Sort key function per column (text by default)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.headers = list(headers or [])
+        self._key_functions = list(key_functions or [text_key] * len(self.headers))
+        self._columns = [[] for _ in self.headers]
+        self._keys = [[] for _ in self.headers]
+        self._paths = []
+        self._ids = []
+        self._next_id = count()
+        self._positions = None  # Row id -> row, rebuilt after rows move
+        self.sort_spec = []  # (column, order) pairs, most significant first
+        self._bulk_depth = 0
+        self._bulk_dirty = False
+        self.version = 0  # Bumped on every change, for caches built from the rows
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        col = index.column()
+        self.version += 1
+        self._columns[col][index.row()] = str(value)
+        self._keys[col][index.row()] = self._key_functions[col](str(value))
+        self.dataChanged.emit(index, index, [role])
+        self.rows_edited.emit([self._ids[index.row()]])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.headers[section] if section < len(self.headers) else None
+            return section + 1
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsSelectable |
+            Qt.ItemFlag.ItemIsEnabled |
+            Qt.ItemFlag.ItemIsEditable
+        )
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._ids):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        self.version += 1
+        for column in self._columns:
+            del column[row:row + count]
+        for keys in self._keys:
+            del keys[row:row + count]
+        del self._paths[row:row + count]
+        del self._ids[row:row + count]
+        self._positions = None
+        self.endRemoveRows()
+        return True
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by one column, keeping equal rows in order"""
+        self.sort_by([(column, order)] if 0 <= column < len(self._columns) else [])
+
+    def sort_by(self, spec):
+        """
+        Stable sort by several columns using the cached sort keys.
+        
+        Args:
+            spec (list): (column, Qt.SortOrder) pairs, most significant first;
+                an empty list turns sorting off
+        """
+        self.sort_spec = [(col, order) for col, order in spec if 0 <= col < len(self._columns)]
+        if not self.sort_spec:
+            return
+        self.apply_permutation(sort_permutation(
+            self._keys,
+            [(col, order == Qt.SortOrder.DescendingOrder) for col, order in self.sort_spec],
+            len(self._ids)
+        ))
+
+    # Row storage
+    def set_headers(self, headers, key_functions=None):
+        """Replace the columns (clears all rows)"""
+        self.beginResetModel()
+        self.version += 1
+        self.headers = list(headers)
+        self._key_functions = list(key_functions or [text_key] * len(self.headers))
+        self._columns = [[] for _ in self.headers]
+        self._keys = [[] for _ in self.headers]
+        self.sort_spec = []
+        self._paths = []
+        self._ids = []
+        self._positions = None
+        self.endResetModel()
+
+    def append_rows(self, rows, paths=None):
+        """
+        Append parsed rows.
+        
+        Args:
+            rows (list): Rows of cell strings (short rows are padded)
+            paths (list): Source path per row, or None
+            
+        Returns:
+            list: Stable ids of the new rows
+        """
+        if not rows:
+            return []
+        start = len(self._ids)
+        new_ids = [next(self._next_id) for _ in rows]
+        
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self.version += 1
+        for col, column in enumerate(self._columns):
+            column.extend(row[col] if col < len(row) else "" for row in rows)
+            self._keys[col].extend(map(self._key_functions[col], column[start:]))
+        self._paths.extend(paths if paths is not None else [None] * len(rows))
+        self._ids.extend(new_ids)
+        if self._positions is not None:
+            self._positions.update(zip(new_ids, range(start, start + len(rows))))
+        self.endInsertRows()
+        
+        # Keep an active sort, like QTableWidget does for new items
+        if self._bulk_depth:
+            self._bulk_dirty = True
+        elif self.sort_spec:
+            self.sort_by(self.sort_spec)
+        return new_ids
+
+    def begin_bulk(self):
+        """
+        Start deferring re-sorts, for appends spread over many event-loop turns.
+        Every call must be matched by end_bulk().
+        """
+        self._bulk_depth += 1
+
+    def end_bulk(self):
+        """End a begin_bulk() block; the outermost one re-sorts once if rows arrived"""
+        self._bulk_depth -= 1
+        if not self._bulk_depth and self._bulk_dirty:
+            self._bulk_dirty = False
+            if self.sort_spec:
+                self.sort_by(self.sort_spec)
+
+    @contextmanager
+    def bulk_insert(self):
+        """
+        Defer re-sorting until a batch of appends is done.
+        
+        Nested blocks re-sort once, when the outermost block ends.
+        """
+        self.begin_bulk()
+        try:
+            yield self
+        finally:
+            self.end_bulk()
+
+    def clear(self):
+        """Remove every row"""
+        self.beginResetModel()
+        self.version += 1
+        for column in self._columns:
+            column.clear()
+        for keys in self._keys:
+            keys.clear()
+        self._paths.clear()
+        self._ids.clear()
+        self._positions = None
+        self.endResetModel()
+
+    def apply_permutation(self, permutation):
+        """
+        Reorder rows so new row i is old row permutation[i].
+        
+        Selections and other persistent indexes follow their rows.
+        """
+        self.layoutAboutToBeChanged.emit([], QAbstractTableModel.LayoutChangeHint.VerticalSortHint)
+        self.version += 1
+        
+        self._columns = [[column[i] for i in permutation] for column in self._columns]
+        self._keys = [[keys[i] for i in permutation] for keys in self._keys]
+        self._paths = [self._paths[i] for i in permutation]
+        self._ids = [self._ids[i] for i in permutation]
+        self._positions = None
+        
+        # Move persistent indexes (selection, current cell) with their rows
+        old_indexes = self.persistentIndexList()
+        if old_indexes:
+            new_rows = [0] * len(permutation)
+            for new_row, old_row in enumerate(permutation):
+                new_rows[old_row] = new_row
+            self.changePersistentIndexList(old_indexes, [
+                self.index(new_rows[index.row()], index.column())
+                for index in old_indexes
+            ])
+        
+        self.layoutChanged.emit([], QAbstractTableModel.LayoutChangeHint.VerticalSortHint)
+
+    def set_rows(self, updates):
+        """
+        Replace the cell text of several rows with one change notification.
+        
+        Args:
+            updates (list): (row, values) pairs
+        """
+        if not updates:
+            return
+        self.version += 1
+        for row, values in updates:
+            for col, value in enumerate(values[:len(self._columns)]):
+                self._columns[col][row] = value
+                self._keys[col][row] = self._key_functions[col](value)
+        rows = [row for row, _ in updates]
+        self.dataChanged.emit(
+            self.index(min(rows), 0),
+            self.index(max(rows), len(self._columns) - 1)
+        )
+        self.rows_edited.emit([self._ids[row] for row in rows])
+        
+        # New text can move rows under an active sort
+        if self._bulk_depth:
+            self._bulk_dirty = True
+        elif self.sort_spec:
+            self.sort_by(self.sort_spec)
+
+    def cell(self, row, col):
+        """Get one cell's text"""
+        return self._columns[col][row]
+
+    def column_values(self, col):
+        """Get a column's cell list (read-only view, do not modify)"""
+        return self._columns[col]
+
+    def row_values(self, row):
+        """Get one row's cell text as a list"""
+        return [column[row] for column in self._columns]
+
+    def row_id(self, row):
+        """Get the stable id of the row at a position"""
+        return self._ids[row]
+
+    def path(self, row):
+        """Get a row's source path (None if unknown)"""
+        return self._paths[row]
+
+    def position_of(self, row_id):
+        """Get the current row of a stable row id, or -1 if it was removed"""
+        if self._positions is None:
+            self._positions = {rid: row for row, rid in enumerate(self._ids)}
+        return self._positions.get(row_id, -1)
+
+    def rows(self, columns=None, positions=None):
+        """
+        Iterate rows as tuples of cell text, straight from column storage.
+        
+        Args:
+            columns (list): Column numbers to include (all if None)
+            positions (iterable): Rows to include, in order (all if None)
+        """
+        selected = [self._columns[col] for col in (columns if columns is not None else range(len(self._columns)))]
+        if not selected:
+            return iter(())
+        if positions is None:
+            return zip(*selected)
+        if isinstance(positions, range) and positions.step == 1:
+            return zip(*(column[positions.start:positions.stop] for column in selected))
+        positions = list(positions)
+        return zip(*(list(map(column.__getitem__, positions)) for column in selected))
@@ -0,0 +1,91 @@
+"""
+Table zoom for MisterLister.
+Applies font size and row spacing changes in constant time.
+"""
+
+from mister_lister.qt import QObject, QTimer, QFont, QFontMetrics, pyqtSignal
+
+ZOOM_DELAY_MS = 150  # Quiet period before rapid +/- presses are applied
+
+class TableZoom(QObject):
+    """
+    Font size and row spacing controller for a table view.
+    
+    Features:
+    - Row height comes from the vertical header's default section size,
+      so applying it costs the same for 10 rows or 1M rows
+    - Rapid changes are debounced into one relayout
+    - Fonts and font metrics are cached per point size
+    """
+    
+    applied = pyqtSignal(float, float)  # (font size, row spacing) once relaid out
+    
+    def __init__(self, table, font_size, spacing, delay=ZOOM_DELAY_MS, parent=None):
+        """
+        Initialize zoom for a table view.
+        
+        Args:
+            table: QTableView to zoom
+            font_size (float): Starting font size in points
+            spacing (float): Starting row height in pixels
+            delay (int): Debounce delay in milliseconds
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.table = table
+        self.font_size = font_size
+        self.spacing = spacing
+        self._base_font = QFont(table.font())
+        self._fonts = {}
+        self._metrics = {}
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.apply)
+
+    def font(self, size=None):
+        """Get the (cached) table font for a point size"""
+        size = int(self.font_size if size is None else size)
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = QFont(self._base_font)
+            font.setPointSize(size)
+        return font
+
+    def metrics(self, size=None):
+        """Get the (cached) font metrics for a point size"""
+        size = int(self.font_size if size is None else size)
+        metrics = self._metrics.get(size)
+        if metrics is None:
+            metrics = self._metrics[size] = QFontMetrics(self.font(size))
+        return metrics
+
+    def row_height(self):
+        """
+        Get the row height for the current spacing and font size.
+        Rows never get shorter than a line of text, so large fonts don't clip.
+        """
+        return max(int(self.spacing), self.metrics().height())
+
+    def set_font_size(self, size):
+        """Change the font size, relaying out after the quiet period"""
+        self.font_size = size
+        self._timer.start()
+
+    def set_spacing(self, spacing):
+        """Change the row spacing, relaying out after the quiet period"""
+        self.spacing = spacing
+        self._timer.start()
+
+    def apply(self):
+        """Apply the current font size and spacing now"""
+        self._timer.stop()
+        self.table.setFont(self.font())
+        self.table.verticalHeader().setDefaultSectionSize(self.row_height())
+        self.applied.emit(self.font_size, self.spacing)
+
+    def flush(self):
+        """Apply a pending change immediately, if there is one"""
+        if self._timer.isActive():
+            self.apply()
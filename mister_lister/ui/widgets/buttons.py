@@ -4,13 +4,12 @@ Provides circular buttons with state-aware icons and styling.
 """
 
 from mister_lister.qt import (
-    QPushButton, QIcon, QSize, Qt
+    QPushButton, QSize, Qt
 )
-from mister_lister.constants import (
-    NORMAL_TAN, HOVER_TAN, LIGHT_BLUE, 
-    DARKER_TAN, INACTIVE_TAN, WHITE
-)
-from pytablericons import TablerIcons, OutlineIcon, FilledIcon
+from mister_lister.constants import DARKER_TAN, INACTIVE_TAN, WHITE
+from mister_lister.ui.styles import set_style_property
+from .icon_cache import cached_icon, filled_variant
+from .icon_atlas import ICON_COLORS
 
 class CircleButton(QPushButton):
     """
@@ -20,15 +19,20 @@ class CircleButton(QPushButton):
     - Interactive/non-interactive states with distinct styling
     - In-use state with filled/outline icon switching
     - Hover and press effects when interactive
-    - Custom color scheme that overrides Qt defaults
+    - Custom color scheme from the shared stylesheet (see ui.styles)
+    - Icons come from a shared cache, so hovering never re-renders them
+    - Icons are named (e.g. "FOLDER") and served from the prebuilt icon atlas
     """
     
+    ICON_SIZE = 32
+    ICON_STROKE = 1.5
+    
     def __init__(self, icon_type="", parent=None):
         """
         Initialize button with specified icon type.
         
         Args:
-            icon_type: TablerIcons icon type (OutlineIcon or FilledIcon)
+            icon_type: Tabler icon name (e.g. "FOLDER") or OutlineIcon member
             parent: Parent widget
         """
         super().__init__(parent)
@@ -36,7 +40,8 @@ class CircleButton(QPushButton):
         
         self._interactive = False
         self._in_use = False
-        self._base_icon_type = icon_type
+        self._base_icon_type = getattr(icon_type, 'name', icon_type)
+        self._icon_key = None
         
         self.update_style()
 
@@ -66,14 +71,11 @@ class CircleButton(QPushButton):
         """
         Get current icon type based on in_use state.
         Falls back to outline version if filled version unavailable.
+        
+        Returns:
+            tuple: (icon name, whether to use the filled version)
         """
-        if self._in_use:
-            try:
-                return getattr(FilledIcon, self._base_icon_type.name)
-            except AttributeError:
-                print(f"Warning: No filled icon found for {self._base_icon_type.name}, using outline version")
-                return self._base_icon_type
-        return self._base_icon_type
+        return self._base_icon_type, self._in_use and filled_variant(self._base_icon_type)
 
     def update_icon(self, color):
         """
@@ -81,20 +83,26 @@ class CircleButton(QPushButton):
         Handles hover states and icon type switching.
         """
         if self._base_icon_type:
-            current_icon_type = self.get_icon_type()
-            
             # Override color with WHITE if button is both interactive and being hovered
             if self.underMouse() and self._interactive:
                 color = WHITE
             
-            icon = TablerIcons.load(
-                current_icon_type,
-                size=32,
-                color=color,
-                stroke_width=1.5
-            )
-            self.setIcon(QIcon(icon.toqpixmap()))
-            self.setIconSize(QSize(32, 32))
+            key = (self.get_icon_type(), color, self.devicePixelRatioF())
+            if key == self._icon_key:
+                return
+            self._icon_key = key
+            name, filled = key[0]
+            self.setIcon(cached_icon(name, filled, self.ICON_SIZE, color, self.ICON_STROKE, key[2]))
+            self.setIconSize(QSize(self.ICON_SIZE, self.ICON_SIZE))
+
+    def prewarm_icons(self):
+        """Render every icon look this button can show, ahead of use"""
+        if not self._base_icon_type:
+            return
+        pixel_ratio = self.devicePixelRatioF()
+        for filled in {False, filled_variant(self._base_icon_type, warn=False)}:
+            for color in ICON_COLORS:
+                cached_icon(self._base_icon_type, filled, self.ICON_SIZE, color, self.ICON_STROKE, pixel_ratio)
 
     def update_style(self):
         """
@@ -104,35 +112,11 @@ class CircleButton(QPushButton):
         base_color = DARKER_TAN if self._interactive else INACTIVE_TAN
         self.update_icon(base_color)
         
+        # Colors come from the shared stylesheet, keyed on this property
+        set_style_property(self, 'interactive', self._interactive)
         if self._interactive:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    border: none;
-                    border-radius: 30px;
-                }}
-                QPushButton:hover {{
-                    background: {HOVER_TAN};
-                }}
-                QPushButton:pressed {{
-                    background: {LIGHT_BLUE};
-                }}
-                QPushButton:disabled {{
-                    background: transparent;
-                }}
-            """)
             self.setCursor(Qt.CursorShape.PointingHandCursor)
         else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    border: none;
-                    border-radius: 30px;
-                }}
-                QPushButton:disabled {{
-                    background: transparent;
-                }}
-            """)
             self.setCursor(Qt.CursorShape.ArrowCursor)
 
     def enterEvent(self, event):
@@ -164,58 +148,8 @@ class SmallIconButton(CircleButton):
     Inherits core functionality but adjusts size and styling.
     """
     
+    ICON_SIZE = 16  # Smaller icon
+    
     def __init__(self, icon_type="", parent=None):
         super().__init__(icon_type, parent)
         self.setFixedSize(24, 24)  # Smaller size
-        
-    def update_style(self):
-        """Update button appearance based on current state"""
-        base_color = DARKER_TAN if self._interactive else INACTIVE_TAN
-        self.update_icon(base_color)
-        
-        # Always use circular styling for both states
-        if self._interactive:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    border: none;
-                    border-radius: 12px;
-                }}
-                QPushButton:hover {{
-                    background: {HOVER_TAN};
-                }}
-                QPushButton:pressed {{
-                    background: {LIGHT_BLUE};
-                }}
-            """)
-            self.setCursor(Qt.CursorShape.PointingHandCursor)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    border: none;
-                    border-radius: 12px;
-                }}
-                QPushButton:disabled {{
-                    color: {INACTIVE_TAN};
-                    background: transparent;
-                }}
-            """)
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-
-    def update_icon(self, color):
-        """Update button icon with specified color"""
-        if self._base_icon_type:
-            current_icon_type = self.get_icon_type()
-            
-            if self.underMouse() and self._interactive:
-                color = WHITE
-            
-            icon = TablerIcons.load(
-                current_icon_type,
-                size=16,  # Smaller icon
-                color=color,
-                stroke_width=1.5
-            )
-            self.setIcon(QIcon(icon.toqpixmap()))
-            self.setIconSize(QSize(16, 16))  # Smaller icon size 
\ No newline at end of file
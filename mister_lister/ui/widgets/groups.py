@@ -7,7 +7,7 @@ from mister_lister.qt import (
     QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, Qt
 )
-from mister_lister.constants import INACTIVE_TAN, DARKER_TAN
+from mister_lister.ui.styles import set_style_property
 
 class ButtonGroup(QWidget):
     """
@@ -18,6 +18,7 @@ class ButtonGroup(QWidget):
     - Consistent spacing and margins
     - Active/inactive state affects label color
     - Transparent background to blend with bottom bar
+    - Colors come from the shared stylesheet (see ui.styles)
     """
     
     def __init__(self, label, parent=None):
@@ -29,12 +30,6 @@ class ButtonGroup(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.setStyleSheet("""
-            QWidget {
-                border: none;
-                background: transparent;
-            }
-        """)
         
         # Main vertical layout
         layout = QVBoxLayout(self)
@@ -51,16 +46,6 @@ class ButtonGroup(QWidget):
         
         # Label below buttons
         self.label_widget = QLabel(label)
-        self.label_widget.setStyleSheet(f"""
-            QLabel {{
-                color: {INACTIVE_TAN};
-                font-family: 'Asap';
-                font-weight: bold;  
-                font-size: 14px;    
-                margin-top: 0px;
-                border: none;
-            }}
-        """)
         self.label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.label_widget)
         
@@ -77,14 +62,4 @@ class ButtonGroup(QWidget):
         The active state changes the label color to provide visual feedback
         about which button groups are currently usable.
         """
-        color = DARKER_TAN if active else INACTIVE_TAN
-        self.label_widget.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-family: 'Asap';
-                font-weight: bold;  
-                font-size: 14px;    
-                margin-top: 0px;
-                border: none;
-            }}
-        """) 
\ No newline at end of file
+        set_style_property(self.label_widget, 'active', active)
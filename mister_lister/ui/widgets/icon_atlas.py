@@ -0,0 +1,192 @@
+"""
+Icon atlas for MisterLister.
+Keeps every button icon look in one prebuilt image, so startup doesn't
+need to render SVGs (or even import pytablericons).
+"""
+
+import os
+import json
+import hashlib
+from importlib.util import find_spec
+from mister_lister.qt import QPixmap, QImage, QPainter, QIcon, QRect, Qt
+from mister_lister.constants import DARKER_TAN, INACTIVE_TAN, WHITE
+
+ICON_COLORS = (DARKER_TAN, INACTIVE_TAN, WHITE)  # Every color a button icon can take
+ATLAS_ICONS = (
+    'FOLDER', 'MINUS', 'PLUS', 'EYE', 'PRINTER',
+    'TRASH', 'SETTINGS', 'X', 'LIST'
+)
+ATLAS_SIZES = (32, 16)  # CircleButton and SmallIconButton icon sizes
+ATLAS_STROKE = 1.5
+ATLAS_FORMAT = 1  # Bump when the file layout changes
+ATLAS_COLUMNS = 16
+
+ATLAS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
+ATLAS_IMAGE = 'icon_atlas.png'
+ATLAS_INDEX = 'icon_atlas.json'
+
+def icon_key(name, filled, size, color, stroke_width):
+    """Build the index key for one icon look"""
+    return f"{name}|{'filled' if filled else 'outline'}|{size}|{color}|{stroke_width}"
+
+def icons_package_stamp():
+    """
+    Identify the installed pytablericons without importing it.
+    (Reading the package version needs importlib.metadata, which is slow to load.)
+    
+    Returns:
+        str: Modification time of the package, or '' if it isn't installed
+    """
+    try:
+        spec = find_spec('pytablericons')
+    except ImportError:
+        return ''
+    if spec is None or not spec.origin or not os.path.exists(spec.origin):
+        return ''
+    return str(os.stat(spec.origin).st_mtime_ns)
+
+def atlas_signature(pixel_ratio):
+    """
+    Fingerprint of everything the atlas is built from.
+    
+    Changing a color constant, the icon list, sizes, the pixel ratio or
+    the installed pytablericons changes the signature, which triggers a rebuild.
+    """
+    source = json.dumps([
+        ATLAS_FORMAT, ATLAS_ICONS, ATLAS_SIZES, ICON_COLORS,
+        ATLAS_STROKE, pixel_ratio, icons_package_stamp()
+    ])
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+def render_icon_image(name, filled, size, color, stroke_width):
+    """
+    Render one icon with pytablericons (imported only here).
+    
+    Returns:
+        QPixmap: The rendered icon, or None if the icon doesn't exist
+    """
+    from pytablericons import TablerIcons, OutlineIcon, FilledIcon
+    icon_type = getattr(FilledIcon if filled else OutlineIcon, name, None)
+    if icon_type is None:
+        return None
+    image = TablerIcons.load(icon_type, size=size, color=color, stroke_width=stroke_width)
+    return image.toqpixmap()
+
+def has_filled_icon(name):
+    """Check with pytablericons whether an icon has a filled version"""
+    from pytablericons import FilledIcon
+    return hasattr(FilledIcon, name)
+
+class IconAtlas:
+    """
+    Prebuilt sheet of icon images with an index of where each one is.
+    
+    Features:
+    - One PNG plus a JSON index in the data folder, loaded as a single QPixmap
+    - Covers every outline/filled, color and size combination the UI uses
+    - Rebuilt automatically when its signature (colors, icons, sizes) changes
+    """
+    
+    def __init__(self, pixmap, index, filled, pixel_ratio):
+        """
+        Initialize from loaded or freshly built parts.
+        
+        Args:
+            pixmap (QPixmap): The whole atlas image
+            index (dict): icon_key -> [x, y, width, height]
+            filled (list): Icon names that have a filled version
+            pixel_ratio (float): Device pixel ratio the icons were rendered for
+        """
+        self.pixmap = pixmap
+        self.index = index
+        self.filled = set(filled)
+        self.pixel_ratio = pixel_ratio
+
+    def icon(self, name, filled, size, color, stroke_width, pixel_ratio):
+        """
+        Get an icon from the atlas.
+        
+        Returns:
+            QIcon: The icon, or None if this look isn't in the atlas
+        """
+        if pixel_ratio != self.pixel_ratio:
+            return None
+        rect = self.index.get(icon_key(name, filled, size, color, stroke_width))
+        if rect is None:
+            return None
+        pixmap = self.pixmap.copy(QRect(*rect))
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        return QIcon(pixmap)
+
+    def has_filled(self, name):
+        """Whether an icon has a filled version (None if the atlas doesn't know it)"""
+        if name not in ATLAS_ICONS:
+            return None
+        return name in self.filled
+
+    @classmethod
+    def load(cls, pixel_ratio, directory=ATLAS_DIR):
+        """
+        Load the atlas if it exists and is up to date.
+        
+        Returns:
+            IconAtlas: The atlas, or None if it's missing or stale
+        """
+        try:
+            with open(os.path.join(directory, ATLAS_INDEX), 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('signature') != atlas_signature(pixel_ratio):
+            return None
+        pixmap = QPixmap(os.path.join(directory, ATLAS_IMAGE))
+        if pixmap.isNull():
+            return None
+        return cls(pixmap, data['icons'], data['filled'], pixel_ratio)
+
+    @classmethod
+    def build(cls, pixel_ratio, directory=ATLAS_DIR):
+        """
+        Render every icon look into a new atlas and save it.
+        
+        Returns:
+            IconAtlas: The new atlas (returned even if saving fails)
+        """
+        filled_names = [name for name in ATLAS_ICONS if has_filled_icon(name)]
+        looks = [
+            (name, filled, size, color)
+            for name in ATLAS_ICONS
+            for filled in ((False, True) if name in filled_names else (False,))
+            for size in ATLAS_SIZES
+            for color in ICON_COLORS
+        ]
+        
+        # Lay icons out on a grid of cells as big as the largest icon
+        cell = round(max(ATLAS_SIZES) * pixel_ratio)
+        rows = -(-len(looks) // ATLAS_COLUMNS)
+        image = QImage(cell * ATLAS_COLUMNS, cell * rows, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        index = {}
+        painter = QPainter(image)
+        for i, (name, filled, size, color) in enumerate(looks):
+            pixmap = render_icon_image(name, filled, round(size * pixel_ratio), color, ATLAS_STROKE)
+            if pixmap is None:
+                continue
+            x, y = (i % ATLAS_COLUMNS) * cell, (i // ATLAS_COLUMNS) * cell
+            painter.drawPixmap(x, y, pixmap)
+            index[icon_key(name, filled, size, color, ATLAS_STROKE)] = [x, y, pixmap.width(), pixmap.height()]
+        painter.end()
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            image.save(os.path.join(directory, ATLAS_IMAGE))
+            with open(os.path.join(directory, ATLAS_INDEX), 'w') as f:
+                json.dump({
+                    'signature': atlas_signature(pixel_ratio),
+                    'icons': index,
+                    'filled': filled_names,
+                }, f, indent=4)
+        except OSError as e:
+            print(f"Error saving icon atlas: {e}")
+        
+        return cls(QPixmap.fromImage(image), index, filled_names, pixel_ratio)
@@ -0,0 +1,84 @@
+"""
+Icon cache for MisterLister.
+Serves each button icon look from the icon atlas (or renders it once) and
+shares it across the app.
+"""
+
+from functools import lru_cache
+from mister_lister.qt import QIcon
+from .icon_atlas import IconAtlas, render_icon_image, has_filled_icon
+
+ICON_CACHE_SIZE = 256  # Distinct icon looks kept (icon, size, color, stroke, scale)
+
+_atlas = None
+_atlas_ratio = None
+
+def get_atlas(pixel_ratio):
+    """
+    Get the icon atlas, loading or rebuilding it on first use.
+    
+    Args:
+        pixel_ratio (float): Device pixel ratio of the first icons needed
+        
+    Returns:
+        IconAtlas: The atlas, or None if it can't be loaded or built
+    """
+    global _atlas, _atlas_ratio
+    if _atlas_ratio is None:
+        _atlas_ratio = pixel_ratio
+        _atlas = IconAtlas.load(pixel_ratio)
+        if _atlas is None:
+            try:
+                _atlas = IconAtlas.build(pixel_ratio)
+            except ImportError as e:
+                print(f"Error building icon atlas: {e}")
+    return _atlas
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def cached_icon(name, filled, size, color, stroke_width=1.5, pixel_ratio=1.0):
+    """
+    Get an icon, from the atlas when possible, rendering it only the first time otherwise.
+    
+    Args:
+        name (str): Tabler icon name, e.g. "FOLDER"
+        filled (bool): Filled rather than outline version
+        size (int): Icon size in device-independent pixels
+        color (str): Icon color
+        stroke_width (float): Outline stroke width
+        pixel_ratio (float): Screen device pixel ratio (renders sharp on HiDPI)
+        
+    Returns:
+        QIcon: The icon (empty if the icon doesn't exist)
+    """
+    atlas = get_atlas(pixel_ratio)
+    if atlas is not None:
+        icon = atlas.icon(name, filled, size, color, stroke_width, pixel_ratio)
+        if icon is not None:
+            return icon
+    
+    # Not in the atlas; fall back to pytablericons
+    pixmap = render_icon_image(name, filled, round(size * pixel_ratio), color, stroke_width)
+    if pixmap is None:
+        return QIcon()
+    pixmap.setDevicePixelRatio(pixel_ratio)
+    return QIcon(pixmap)
+
+@lru_cache(maxsize=None)
+def has_filled(name):
+    """Whether an icon has a filled version"""
+    known = _atlas.has_filled(name) if _atlas is not None else None
+    return has_filled_icon(name) if known is None else known
+
+def filled_variant(name, warn=True):
+    """
+    Check whether to show an icon's filled version.
+    Falls back to the outline version if there is no filled version.
+    
+    Returns:
+        bool: True if the filled version exists
+    """
+    if not has_filled(name):
+        if warn:
+            print(f"Warning: No filled icon found for {name}, using outline version")
+        return False
+    return True
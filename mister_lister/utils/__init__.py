@@ -2,7 +2,24 @@
 Utility functions and helpers for MisterLister.
 """
 
-from .text_processing import split_by_type, convert_short_date
+from .text_processing import (
+    split_by_type, split_many,
+    convert_short_date, convert_many
+)
+from .schema import FilenameSchema, load_schema
+from .parsing import parse_files, create_parse_pool
+from .file_walker import walk_files, iter_batches, walk_config_batches
+from .path_index import PathIndex
+from .trigram_index import TrigramIndex
+from .sort_keys import key_functions_for, sort_permutation, use_locale_collation
 from .config import Config
 
-__all__ = ['split_by_type', 'convert_short_date', 'Config'] 
\ No newline at end of file
+__all__ = [
+    'split_by_type', 'split_many',
+    'convert_short_date', 'convert_many',
+    'FilenameSchema', 'load_schema',
+    'parse_files', 'create_parse_pool',
+    'walk_files', 'iter_batches', 'walk_config_batches',
+    'PathIndex', 'TrigramIndex', 'key_functions_for', 'sort_permutation',
+    'use_locale_collation', 'Config'
+] 
\ No newline at end of file
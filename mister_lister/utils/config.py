@@ -5,6 +5,9 @@ Provides consistent type conversion and value handling.
 
 import os
 import json
+import atexit
+import tempfile
+import threading
 from mister_lister.constants import (
     DEFAULT_FONT_SIZE,
     DEFAULT_ROW_SPACING,
@@ -13,9 +16,21 @@ from mister_lister.constants import (
     DEFAULT_BORDER_GRAY,
     DEFAULT_REMEMBER_DIR,
     DEFAULT_REMEMBER_LAYOUT,
-    DEFAULT_SHOW_DIALOG
+    DEFAULT_SHOW_DIALOG,
+    DEFAULT_PARALLEL_THRESHOLD,
+    DEFAULT_BATCH_SIZE,
+    CONFIG_WRITE_DELAY
 )
 
+def _new_file_mode():
+    """Get the mode open() gives new files under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Read once at import, before any worker threads create files
+_NEW_FILE_MODE = _new_file_mode()
+
 class Config:
     """
     Configuration manager with JSON persistence and type safety.
@@ -24,10 +39,27 @@ class Config:
     - JSON-based configuration storage
     - Type-safe value getting/setting
     - Centralized default values
+    - Write-behind saving: changes are written once after a quiet period
+      (and on exit), atomically, so a crash can't truncate the file
+    - Thread-safe, so background workers can read settings
     """
     
-    def __init__(self):
-        """Initialize configuration with defaults"""
+    def __init__(self, write_delay=CONFIG_WRITE_DELAY, config_dir=None):
+        """
+        Initialize configuration with defaults.
+        
+        Args:
+            write_delay (float): Seconds to wait for more changes before
+                writing; 0 writes on every change
+            config_dir (str): Folder holding config.json (defaults to the
+                package's data folder)
+        """
+        self.write_delay = write_delay
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._timer = None
+        self._exit_hooked = False
+        
         self.type_map = {
             # Layout settings
             'layout/font_size': float,
@@ -45,6 +77,16 @@ class Config:
             'files/remember_dir': bool,
             'files/default_dir': str,
             'files/backup_dir': str,
+            'files/parallel_threshold': int,
+            'files/include_patterns': str,
+            'files/exclude_patterns': str,
+            'files/max_depth': int,
+            'files/batch_size': int,
+            'files/duplicates': str,
+            
+            # Parsing settings
+            'parsing/schema': str,
+            'parsing/schemas': dict,
             
             # Startup settings
             'startup/show_dialog': bool,
@@ -67,13 +109,23 @@ class Config:
             'files/remember_dir': False,
             'files/default_dir': '',
             'files/backup_dir': '',
+            'files/parallel_threshold': DEFAULT_PARALLEL_THRESHOLD,
+            'files/include_patterns': '',
+            'files/exclude_patterns': '',
+            'files/max_depth': -1,
+            'files/batch_size': DEFAULT_BATCH_SIZE,
+            'files/duplicates': 'skip',
+            
+            # Parsing defaults
+            'parsing/schema': 'default',
+            'parsing/schemas': {},
             
             # Startup defaults
             'startup/show_dialog': False,
         }
         
         # Load or create config file
-        self.config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        self.config_dir = config_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
         os.makedirs(self.config_dir, exist_ok=True)
         self.config_file = os.path.join(self.config_dir, 'config.json')
         
@@ -98,12 +150,59 @@ class Config:
             self.save_config()
 
     def save_config(self):
-        """Save configuration to JSON file"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        """
+        Save configuration to JSON file now.
+        
+        Writes to a temporary file and renames it over the config file, so
+        the file on disk is always either the old or the new version.
+        """
+        with self._lock:
+            self._dirty = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            data = dict(self.config)
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=self.config_dir, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(data, f, indent=4)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    # mkstemp makes the file owner-only; keep the config's own mode
+                    try:
+                        mode = os.stat(self.config_file).st_mode & 0o7777
+                    except FileNotFoundError:
+                        mode = _NEW_FILE_MODE
+                    os.chmod(temp_path, mode)
+                    os.replace(temp_path, self.config_file)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+            except Exception as e:
+                print(f"Error saving config: {e}")
+
+    def flush(self):
+        """Write pending changes now, if there are any"""
+        with self._lock:
+            if self._dirty:
+                self.save_config()
+
+    def _schedule_save(self):
+        """Mark the config changed and (re)start the quiet-period timer"""
+        if self.write_delay <= 0:
+            self.save_config()
+            return
+        self._dirty = True
+        if self._timer is not None:
+            self._timer.cancel()
+        if not self._exit_hooked:
+            # Make sure a change still waiting for its timer is written on exit
+            atexit.register(self.flush)
+            self._exit_hooked = True
+        self._timer = threading.Timer(self.write_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
 
     def get_value(self, key, default=None):
         """
@@ -122,7 +221,8 @@ class Config:
         if default is None:
             default = self.defaults.get(key)
             
-        raw_value = self.config.get(key, default)
+        with self._lock:
+            raw_value = self.config.get(key, default)
         expected_type = self.type_map[key]
         
         # Handle type conversion
@@ -140,6 +240,9 @@ class Config:
         """
         Set a config value with type validation.
         
+        The file is written once changes stop for write_delay seconds
+        (see flush() to write immediately).
+        
         Args:
             key: Config key
             value: Value to store
@@ -150,15 +253,17 @@ class Config:
         expected_type = self.type_map[key]
         try:
             typed_value = expected_type(value)
-            self.config[key] = typed_value
-            self.save_config()
+            with self._lock:
+                self.config[key] = typed_value
+                self._schedule_save()
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid value for {key}: {value}. Expected {expected_type.__name__}") from e
 
     def reset_to_defaults(self):
         """Reset all config to default values"""
-        self.config = self.defaults.copy()
-        self.save_config()
+        with self._lock:
+            self.config = self.defaults.copy()
+            self.save_config()
 
     # Type-specific convenience methods
     def get_bool(self, key, default=None):
@@ -0,0 +1,109 @@
+"""
+Folder ingestion for MisterLister.
+Streams file paths out of dropped or selected folders.
+"""
+
+import os
+from fnmatch import fnmatch
+from itertools import islice
+from mister_lister.constants import DEFAULT_BATCH_SIZE
+
+def split_patterns(text):
+    """
+    Split a pattern setting like "*.pdf; *.tif" into a list.
+    
+    Args:
+        text (str): Patterns separated by semicolons or commas
+        
+    Returns:
+        list: Non-empty glob patterns
+    """
+    return [part.strip() for part in text.replace(',', ';').split(';') if part.strip()]
+
+def _matches(name, patterns):
+    """Check a file or folder name against glob patterns"""
+    return any(fnmatch(name, pattern) for pattern in patterns)
+
+def walk_files(paths, include=None, exclude=None, max_depth=None):
+    """
+    Yield file paths, expanding folders recursively with os.scandir.
+    
+    Args:
+        paths (iterable): Files and/or folders
+        include (list): Glob patterns a file name must match (all files if empty)
+        exclude (list): Glob patterns that skip matching files and folders
+        max_depth (int): Levels of subfolders to enter (None or negative for
+            no limit, 0 for the folder's own files only)
+            
+    Yields:
+        str: File paths, each folder's entries in name order
+    """
+    include = include or []
+    exclude = exclude or []
+    unlimited = max_depth is None or max_depth < 0
+    
+    for path in paths:
+        if not os.path.isdir(path):
+            # Explicitly named files are always listed
+            yield path
+            continue
+        
+        # Depth-first, so nested date folders stream out one at a time
+        stack = [(path, 0)]
+        while stack:
+            folder, depth = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError as e:
+                print(f"Error reading folder {folder}: {e}")
+                continue
+            
+            subfolders = []
+            for entry in entries:
+                if exclude and _matches(entry.name, exclude):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if unlimited or depth < max_depth:
+                            subfolders.append((entry.path, depth + 1))
+                    elif entry.is_file() and (not include or _matches(entry.name, include)):
+                        yield entry.path
+                except OSError:
+                    continue
+            
+            # Push in reverse so subfolders are visited in name order
+            stack.extend(reversed(subfolders))
+
+def iter_batches(items, size=DEFAULT_BATCH_SIZE):
+    """
+    Group an iterable into lists of at most size items.
+    
+    Yields:
+        list: Next batch
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def walk_config_batches(paths, config):
+    """
+    Stream batches of file paths using the folder settings in config.
+    
+    Args:
+        paths (iterable): Files and/or folders
+        config: Config instance
+        
+    Returns:
+        generator: Batches of file paths
+    """
+    files = walk_files(
+        paths,
+        include=split_patterns(config.get_str('files/include_patterns')),
+        exclude=split_patterns(config.get_str('files/exclude_patterns')),
+        max_depth=config.get_int('files/max_depth')
+    )
+    return iter_batches(files, max(1, config.get_int('files/batch_size')))
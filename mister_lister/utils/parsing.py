@@ -0,0 +1,85 @@
+"""
+Filename parsing for MisterLister.
+Turns file paths into table rows, serially or across worker processes.
+"""
+
+import logging
+import os
+from mister_lister.constants import DEFAULT_PARALLEL_THRESHOLD
+from .schema import DEFAULT_SCHEMA
+
+MIN_CHUNK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+def create_parse_pool(max_workers=None):
+    """
+    Create a process pool parse_files can reuse across calls.
+    
+    Workers are spawned, not forked: parsing runs on a worker thread of a
+    multithreaded Qt process, and a forked child could inherit locks held
+    by other threads.
+    
+    Args:
+        max_workers (int): Pool size (defaults to the CPU count)
+        
+    Returns:
+        ProcessPoolExecutor: The pool, or None if there's only one CPU
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers < 2:
+        return None
+    
+    # Only large imports pay for loading the pool machinery
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+def parse_files(file_paths, schema=None, parallel_threshold=DEFAULT_PARALLEL_THRESHOLD,
+                max_workers=None, pool=None):
+    """
+    Parse file paths into table rows, using a process pool for large lists.
+    
+    Args:
+        file_paths (list): Paths to parse
+        schema (FilenameSchema): Compiled schema (defaults to the built-in one)
+        parallel_threshold (int): Row count at which parsing moves to a
+            process pool (0 disables parallel parsing)
+        max_workers (int): Pool size (defaults to the CPU count)
+        pool (ProcessPoolExecutor): Pool from create_parse_pool to use
+            instead of starting one for this call
+        
+    Returns:
+        list: Parsed rows in input order
+    """
+    schema = schema or DEFAULT_SCHEMA
+    file_paths = list(file_paths)
+    if not parallel_threshold or len(file_paths) < parallel_threshold:
+        return schema.parse_many(file_paths)
+    
+    workers = max_workers or os.cpu_count() or 1
+    if pool is None and workers < 2:
+        return schema.parse_many(file_paths)
+    from concurrent.futures.process import BrokenProcessPool
+    
+    # A few chunks per worker keeps the pool busy without tiny tasks
+    chunk_size = max(MIN_CHUNK_SIZE, -(-len(file_paths) // (workers * 4)))
+    chunks = [
+        file_paths[start:start + chunk_size]
+        for start in range(0, len(file_paths), chunk_size)
+    ]
+    
+    own_pool = None
+    try:
+        if pool is None:
+            pool = own_pool = create_parse_pool(workers)
+        rows = []
+        for chunk_rows in pool.map(schema.parse_many, chunks):
+            rows.extend(chunk_rows)
+        return rows
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning("Parallel parsing unavailable, parsing serially: %s", e)
+        return schema.parse_many(file_paths)
+    finally:
+        if own_pool is not None:
+            own_pool.shutdown()
@@ -0,0 +1,46 @@
+"""
+Duplicate path tracking for MisterLister.
+Keeps an O(1) index of the files already listed in the table.
+"""
+
+import os
+
+class PathIndex:
+    """
+    Hash index of normalized absolute file paths.
+    
+    Features:
+    - Paths are normalized so different spellings of one file match
+    - Each path maps to the model row id of its row
+    - Membership, insert and removal are all O(1)
+    """
+    
+    def __init__(self):
+        self._entries = {}
+
+    @staticmethod
+    def normalize(path):
+        """Get the key used for a path (absolute, normalized, case-folded on Windows)"""
+        return os.path.normcase(os.path.abspath(path))
+
+    def __contains__(self, path):
+        return self.normalize(path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path, default=None):
+        """Get the row id stored for a path"""
+        return self._entries.get(self.normalize(path), default)
+
+    def add(self, path, row_id):
+        """Record a path and its row id"""
+        self._entries[self.normalize(path)] = row_id
+
+    def discard(self, path):
+        """Forget a path if it's indexed"""
+        self._entries.pop(self.normalize(path), None)
+
+    def clear(self):
+        """Forget every path"""
+        self._entries.clear()
@@ -0,0 +1,161 @@
+"""
+Filename schemas for MisterLister.
+Compiles named column layouts into reusable filename parsers.
+"""
+
+import os
+import re
+from .text_processing import split_many, convert_many
+
+def _upper_column(values):
+    """Upper-case every value in a column"""
+    return [value.upper() for value in values]
+
+# Column converters work on a whole column at a time; None means free text
+CONVERTERS = {
+    'text': None,
+    'date': convert_many,
+    'upper': _upper_column,
+}
+
+# Built-in schemas, always available alongside any defined in config
+BUILTIN_SCHEMAS = {
+    'default': {
+        'columns': [
+            {'name': 'lastname', 'type': 'text'},
+            {'name': 'firstname', 'type': 'text'},
+            {'name': 'dob', 'type': 'date'},
+            {'name': 'item', 'type': 'text'},
+            {'name': 'date', 'type': 'date'},
+        ],
+    },
+}
+
+DEFAULT_SCHEMA_NAME = 'default'
+
+class FilenameSchema:
+    """
+    Compiled filename schema that turns file paths into table rows.
+    
+    Features:
+    - Named columns with per-column converters (text, date, upper)
+    - Token mode splits filenames by character type (split_by_type rules)
+    - Pattern mode matches a precompiled regex, one group per column
+    - Converters are resolved once, so parsing does no per-row branching
+    """
+    
+    def __init__(self, name, columns, pattern=None):
+        """
+        Compile a schema definition.
+        
+        Args:
+            name (str): Schema name
+            columns (list): Column dicts with 'name' and optional 'type'
+            pattern (str): Optional regex matched against the filename;
+                unmatched filenames fall back to token splitting
+        """
+        if not columns:
+            raise ValueError(f"Schema '{name}' has no columns")
+        
+        self.name = name
+        self.headers = [column['name'] for column in columns]
+        self.column_count = len(columns)
+        self.pattern = re.compile(pattern) if pattern else None
+        if self.pattern and self.pattern.groups != self.column_count:
+            raise ValueError(
+                f"Schema '{name}' pattern has {self.pattern.groups} groups "
+                f"for {self.column_count} columns"
+            )
+        
+        # Keep only columns that actually need converting
+        self.types = [column.get('type', 'text') for column in columns]
+        self.converters = []
+        for col, kind in enumerate(self.types):
+            if kind not in CONVERTERS:
+                raise ValueError(f"Unknown column type in schema '{name}': {kind}")
+            if CONVERTERS[kind]:
+                self.converters.append((col, CONVERTERS[kind]))
+
+    @classmethod
+    def from_definition(cls, name, definition):
+        """Compile a schema from its config dictionary"""
+        return cls(name, definition.get('columns', []), definition.get('pattern'))
+
+    def _token_rows(self, filenames):
+        """Split filenames into padded rows by character type"""
+        count = self.column_count
+        rows = []
+        for segments in split_many(filenames):
+            row = [segment.strip() for segment in segments[:count]]
+            row.extend([""] * (count - len(row)))
+            rows.append(row)
+        return rows
+
+    def _pattern_rows(self, filenames):
+        """Match filenames against the schema pattern"""
+        match = self.pattern.fullmatch
+        rows = []
+        unmatched = []
+        for index, filename in enumerate(filenames):
+            found = match(filename)
+            if found:
+                rows.append([(group or "").strip() for group in found.groups()])
+            else:
+                rows.append(None)
+                unmatched.append(index)
+        
+        if unmatched:
+            fallback = self._token_rows([filenames[index] for index in unmatched])
+            for index, row in zip(unmatched, fallback):
+                rows[index] = row
+        return rows
+
+    def parse_many(self, file_paths):
+        """
+        Parse file paths into table rows.
+        
+        Args:
+            file_paths (iterable): Paths to parse
+            
+        Returns:
+            list: One list of column_count cell strings per path
+        """
+        filenames = [os.path.basename(path) for path in file_paths]
+        rows = self._pattern_rows(filenames) if self.pattern else self._token_rows(filenames)
+        
+        # Convert whole columns at once
+        for col, convert in self.converters:
+            for row, value in zip(rows, convert([row[col] for row in rows])):
+                row[col] = value
+        return rows
+
+    def parse(self, file_path):
+        """Parse a single file path into a table row"""
+        return self.parse_many([file_path])[0]
+
+def load_schema(config):
+    """
+    Compile the schema selected in config.
+    
+    Falls back to the built-in default if the selected schema is missing
+    or invalid.
+    
+    Args:
+        config: Config instance
+        
+    Returns:
+        FilenameSchema: Compiled schema
+    """
+    definitions = {**BUILTIN_SCHEMAS, **config.get_value('parsing/schemas')}
+    name = config.get_str('parsing/schema')
+    try:
+        return FilenameSchema.from_definition(name, definitions[name])
+    except (KeyError, ValueError, TypeError, re.error) as e:
+        print(f"Error loading schema '{name}': {e}. Using default schema.")
+        return FilenameSchema.from_definition(
+            DEFAULT_SCHEMA_NAME, BUILTIN_SCHEMAS[DEFAULT_SCHEMA_NAME]
+        )
+
+DEFAULT_SCHEMA = FilenameSchema.from_definition(
+    DEFAULT_SCHEMA_NAME, BUILTIN_SCHEMAS[DEFAULT_SCHEMA_NAME]
+)
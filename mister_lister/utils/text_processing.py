@@ -3,8 +3,87 @@ Text processing utilities for MisterLister.
 Handles filename parsing and date conversion.
 """
 
+import re
 import unicodedata
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+# Two-digit year pivot for short dates, fixed once per process
+_PIVOT_YY = datetime.now().year % 100
+
+# Every Unicode general category, each mapped to a single code character so a
+# string can be rewritten as a "category string" and scanned with a regex.
+_CATEGORIES = (
+    'Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Mn', 'Mc', 'Me', 'Nd', 'Nl', 'No',
+    'Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po', 'Sm', 'Sc', 'Sk', 'So',
+    'Zs', 'Zl', 'Zp', 'Cc', 'Cf', 'Cs', 'Co', 'Cn'
+)
+_CATEGORY_CODES = {cat: chr(0x41 + i) for i, cat in enumerate(_CATEGORIES)}
+
+# Precomputed category of every ASCII character
+_ASCII_CATEGORIES = tuple(unicodedata.category(chr(i)) for i in range(128))
+
+class _CategoryTable(dict):
+    """Code point -> category code table, filled lazily past ASCII"""
+
+    def __missing__(self, code_point):
+        code = self[code_point] = _CATEGORY_CODES[unicodedata.category(chr(code_point))]
+        return code
+
+_CATEGORY_TABLE = _CategoryTable(
+    (i, _CATEGORY_CODES[cat]) for i, cat in enumerate(_ASCII_CATEGORIES)
+)
+
+def _segment_pattern(member_classes):
+    """
+    Build a segment regex from per-category character classes.
+
+    A segment is any run of non-split characters followed by at most one
+    run of a single split category, which matches the original
+    character-by-character rules of split_by_type.
+    """
+    runs = '|'.join(f'[{cls}]+' for cls in member_classes if cls)
+    members = ''.join(member_classes)
+    head = f'[^{members}]*' if members else '.*'
+    return re.compile(f'{head}(?:{runs})?' if runs else head, re.DOTALL)
+
+@lru_cache(maxsize=None)
+def _compile_tokenizer(filter_categories):
+    """
+    Compile ASCII and Unicode segment patterns for a set of categories.
+    
+    Args:
+        filter_categories (frozenset): Categories that end a segment
+        
+    Returns:
+        tuple: (ascii_pattern, unicode_pattern) where the ASCII pattern runs
+        on the string itself and the Unicode pattern runs on its category string
+    """
+    ordered = [cat for cat in _CATEGORIES if cat in filter_categories]
+    ascii_classes = [
+        re.escape(''.join(
+            chr(i) for i, cat in enumerate(_ASCII_CATEGORIES) if cat == wanted
+        ))
+        for wanted in ordered
+    ]
+    # Codes past 'Z' are [ \ ] ^, which must be escaped inside a class
+    code_classes = [re.escape(_CATEGORY_CODES[cat]) for cat in ordered]
+    return _segment_pattern(ascii_classes), _segment_pattern(code_classes)
+
+def _tokenize(s, ascii_pattern, unicode_pattern):
+    """Split a string with compiled patterns, slicing instead of concatenating"""
+    if not s:
+        return []
+    if s.isascii():
+        # Every match but the trailing empty one is a segment
+        return ascii_pattern.findall(s)[:-1]
+    codes = s.translate(_CATEGORY_TABLE)
+    return [s[m.start():m.end()] for m in unicode_pattern.finditer(codes) if m.end() > m.start()]
+
+def _resolve_filters(args):
+    """Map split-point example characters to their compiled patterns"""
+    args = args if args else ("A", "1")
+    return _compile_tokenizer(frozenset(unicodedata.category(char) for char in args))
 
 def split_by_type(s, *args):
     """
@@ -17,30 +96,47 @@ def split_by_type(s, *args):
     Returns:
         list: List of string segments
     """
-    if not s:
-        return []
-    
-    args = args if args else ("A", "1")
-    type_filters = {unicodedata.category(char) for char in args}
+    return _tokenize(s, *_resolve_filters(args))
+
+def split_many(filenames, *args):
+    """
+    Split many strings at once, resolving the split categories only once.
     
-    result = []
-    current_segment = s[0]
-    prev_type = unicodedata.category(s[0])
+    Args:
+        filenames (iterable): Strings to split
+        *args: Character types to use as split points (defaults to "A" and "1")
+        
+    Returns:
+        list: One list of segments per input string, same as split_by_type
+    """
+    ascii_pattern, unicode_pattern = _resolve_filters(args)
+    return [_tokenize(name, ascii_pattern, unicode_pattern) for name in filenames]
+
+@lru_cache(maxsize=None)
+def _short_date_table(pivot_yy):
+    """
+    Build every valid MMDDYY -> MM-DD-YYYY mapping for a pivot year.
     
-    for char in s[1:]:
-        char_type = unicodedata.category(char)
-        if not args or prev_type in type_filters:
-            if char_type != prev_type:
-                result.append(current_segment)
-                current_segment = char
-            else:
-                current_segment += char
-        else:
-            current_segment += char
-        prev_type = char_type
+    Two-digit years above the pivot land in the 1900s, the rest in the
+    2000s. Covers one full century of calendar days (about 36.5k entries).
     
-    result.append(current_segment)
-    return result
+    Args:
+        pivot_yy (int): Last two digits of the pivot year
+        
+    Returns:
+        dict: Short date string -> formatted date string
+    """
+    table = {}
+    one_day = timedelta(days=1)
+    for yy in range(100):
+        year = (1900 if yy > pivot_yy else 2000) + yy
+        day = date(year, 1, 1)
+        while day.year == year:
+            table[f"{day.month:02d}{day.day:02d}{yy:02d}"] = (
+                f"{day.month:02d}-{day.day:02d}-{year}"
+            )
+            day += one_day
+    return table
 
 def convert_short_date(date_str):
     """
@@ -54,15 +150,20 @@ def convert_short_date(date_str):
     """
     if len(date_str.strip()) != 6:
         return date_str
+    return _short_date_table(_PIVOT_YY).get(date_str[:6], date_str)
+
+def convert_many(date_strs):
+    """
+    Convert a whole column of 6-digit dates at once.
+    
+    Args:
+        date_strs (iterable): Date strings (MMDDYY)
         
-    try:
-        mm = date_str[:2]
-        dd = date_str[2:4]
-        yy = date_str[4:6]
-        current_yy = datetime.now().year % 100
-        year_prefix = "19" if int(yy) > current_yy else "20"
-        full_year = f"{year_prefix}{yy}"
-        datetime.strptime(f"{mm}{dd}{full_year}", "%m%d%Y")
-        return f"{mm}-{dd}-{full_year}"
-    except ValueError:
-        return date_str 
\ No newline at end of file
+    Returns:
+        list: Converted values, same as convert_short_date on each item
+    """
+    lookup = _short_date_table(_PIVOT_YY).get
+    return [
+        lookup(value, value) if len(value) == 6 else convert_short_date(value)
+        for value in date_strs
+    ]
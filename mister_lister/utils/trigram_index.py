@@ -0,0 +1,119 @@
+"""
+Search index for MisterLister.
+Finds rows containing a piece of text without scanning every row.
+"""
+
+def _trigrams(text):
+    """Get the distinct trigrams of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class TrigramIndex:
+    """
+    Incremental inverted trigram index over table rows.
+    
+    Features:
+    - Indexes distinct cell values, so repeated names and dates cost one
+      dictionary lookup per cell instead of re-indexing their trigrams
+    - Rows are added, updated and removed one at a time as the table changes
+    - Candidates come from intersecting the shortest posting lists and are
+      then verified, so results are exact case-insensitive substring matches
+    """
+    
+    def __init__(self):
+        self._grams = {}        # trigram -> set of cell values containing it
+        self._value_rows = {}   # cell value -> set of row ids
+        self._row_values = {}   # row id -> tuple of cell values
+
+    def __len__(self):
+        return len(self._row_values)
+
+    def add(self, row_id, cells):
+        """
+        Index a row.
+        
+        Args:
+            row_id (int): Stable row id
+            cells (iterable): The row's cell strings
+        """
+        values = tuple({cell.casefold() for cell in cells if cell})
+        self._row_values[row_id] = values
+        value_rows = self._value_rows
+        for value in values:
+            rows = value_rows.get(value)
+            if rows is None:
+                rows = value_rows[value] = set()
+                grams = self._grams
+                for gram in _trigrams(value):
+                    posting = grams.get(gram)
+                    if posting is None:
+                        posting = grams[gram] = set()
+                    posting.add(value)
+            rows.add(row_id)
+
+    def add_many(self, row_ids, rows):
+        """Index several rows"""
+        for row_id, cells in zip(row_ids, rows):
+            self.add(row_id, cells)
+
+    def remove(self, row_id):
+        """Stop matching a row"""
+        values = self._row_values.pop(row_id, None)
+        if values is None:
+            return
+        value_rows = self._value_rows
+        for value in values:
+            rows = value_rows[value]
+            rows.discard(row_id)
+            if not rows:
+                # Last row using this value; drop it from the postings too
+                del value_rows[value]
+                for gram in _trigrams(value):
+                    posting = self._grams[gram]
+                    posting.discard(value)
+                    if not posting:
+                        del self._grams[gram]
+
+    def update(self, row_id, cells):
+        """Re-index a row whose cells changed"""
+        self.remove(row_id)
+        self.add(row_id, cells)
+
+    def clear(self):
+        """Forget every row"""
+        self._grams.clear()
+        self._value_rows.clear()
+        self._row_values.clear()
+
+    def search(self, query):
+        """
+        Find rows with a cell containing the query (case-insensitive).
+        
+        Args:
+            query (str): Text to look for
+            
+        Returns:
+            set: Matching row ids
+        """
+        needle = query.casefold()
+        if not needle:
+            return set(self._row_values)
+        
+        if len(needle) < 3:
+            # Too short for trigrams; distinct values are few enough to scan
+            values = [value for value in self._value_rows if needle in value]
+        else:
+            postings = []
+            for gram in _trigrams(needle):
+                posting = self._grams.get(gram)
+                if posting is None:
+                    return set()
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:3])
+            values = [value for value in candidates if needle in value]
+        
+        matches = set()
+        value_rows = self._value_rows
+        for value in values:
+            matches.update(value_rows[value])
+        return matches
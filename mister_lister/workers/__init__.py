@@ -0,0 +1,7 @@
+"""
+Background workers for MisterLister.
+"""
+from .ingest_worker import IngestWorker
+from .print_worker import PrintJobWorker, PrintQueue
+
+__all__ = ['IngestWorker', 'PrintJobWorker', 'PrintQueue']
@@ -0,0 +1,108 @@
+"""
+Background file ingestion for MisterLister.
+Walks and parses files off the GUI thread and hands rows back in batches.
+"""
+
+import threading
+from mister_lister.qt import QThread, pyqtSignal
+from mister_lister.utils import parse_files, create_parse_pool
+
+MAX_BUFFERED_ROWS = 20000  # Parsed rows held before the worker waits for the GUI
+
+class IngestWorker(QThread):
+    """
+    Thread that parses batches of file paths into table rows.
+    
+    Features:
+    - Parsed rows collect in a bounded buffer drained by the GUI thread
+    - Row notifications are coalesced: one signal until the GUI takes rows
+    - One process pool is kept for the whole import, shared by large batches
+    - Cooperative cancellation, checked between batches
+    """
+    
+    rows_available = pyqtSignal()
+    
+    def __init__(self, batches, schema, parallel_threshold, total=0, parent=None):
+        """
+        Initialize worker with the batches to parse.
+        
+        Args:
+            batches (iterable): Lists of file paths (may walk folders lazily)
+            schema (FilenameSchema): Compiled schema used to parse
+            parallel_threshold (int): Batch size at which parsing uses a process pool
+            total (int): Number of files if known up front, else 0 (for progress)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.batches = batches
+        self.schema = schema
+        self.parallel_threshold = parallel_threshold
+        self.total = total
+        
+        self._buffer = []
+        self._notified = False
+        self._cancelled = False
+        self._lock = threading.Condition()
+
+    def run(self):
+        """Parse every batch, waiting whenever the buffer is full"""
+        pool = None
+        try:
+            for batch in self.batches:
+                if self._cancelled:
+                    return
+                if pool is None and self.parallel_threshold and len(batch) >= self.parallel_threshold:
+                    pool = create_parse_pool()
+                rows = parse_files(
+                    batch,
+                    schema=self.schema,
+                    parallel_threshold=self.parallel_threshold,
+                    pool=pool
+                )
+                
+                with self._lock:
+                    while len(self._buffer) >= MAX_BUFFERED_ROWS and not self._cancelled:
+                        self._lock.wait()
+                    if self._cancelled:
+                        return
+                    self._buffer.extend(zip(batch, rows))
+                    notify = not self._notified
+                    self._notified = True
+                
+                if notify:
+                    self.rows_available.emit()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def take_rows(self, limit):
+        """
+        Take up to limit parsed rows (called from the GUI thread).
+        
+        Args:
+            limit (int): Maximum rows to return
+            
+        Returns:
+            tuple: (entries, more) where entries are (path, row) pairs and
+            more is True if rows are still buffered
+        """
+        with self._lock:
+            entries = self._buffer[:limit]
+            del self._buffer[:limit]
+            more = bool(self._buffer)
+            # Next batch from the worker should signal again
+            self._notified = more
+            self._lock.notify_all()
+        return entries, more
+
+    def cancel(self):
+        """Stop after the current batch and drop buffered rows"""
+        with self._lock:
+            self._cancelled = True
+            self._buffer = []
+            self._lock.notify_all()
+
+    @property
+    def cancelled(self):
+        """Whether cancel() has been called"""
+        return self._cancelled
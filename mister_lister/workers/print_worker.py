@@ -0,0 +1,175 @@
+"""
+Background printing for MisterLister.
+Runs print and PDF export jobs one after another off the GUI thread.
+"""
+
+import os
+from mister_lister.qt import QThread, QObject, pyqtSignal
+from mister_lister.printing import TablePainter, pdf_writer
+from mister_lister.print_jobs import RUNNING, DONE, FAILED, CANCELLED
+
+class PrintJobWorker(QThread):
+    """
+    Thread that paints one job onto a printer or into a PDF.
+    
+    Features:
+    - Same page painter, page layout and border settings as print_table
+    - Page progress reporting and cooperative cancellation
+    - A cancelled or failed PDF export leaves no partial file behind
+    """
+    
+    progress = pyqtSignal(int, int)  # (pages done, total pages)
+    
+    def __init__(self, job, page_layout=None, parent=None):
+        """
+        Initialize worker with a job.
+        
+        Args:
+            job (PrintJob): The job to run
+            page_layout (QPageLayout): Page setup for PDFs, e.g. from the configured printer
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.job = job
+        self.page_layout = page_layout
+        self._cancelled = False
+
+    def run(self):
+        """Paint every page, stopping early if cancelled"""
+        job = self.job
+        device = table = None
+        try:
+            if job.pdf_path:
+                device = pdf_writer(job.pdf_path, self.page_layout)
+            else:
+                from mister_lister.qt import QPrinter  # Print support loads on first use
+                device = QPrinter(QPrinter.PrinterMode.HighResolution)
+                if job.printer_name:
+                    device.setPrinterName(job.printer_name)
+            table = TablePainter(device, job.headers, job.layout, job.font)
+            total = table.page_count(len(job.rows))
+            
+            def on_page(done):
+                self.progress.emit(done, total)
+                return not self._cancelled
+            
+            if not table.print_pages(device, table.pages(job.rows), on_page):
+                job.error = "could not open the print device"
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            # Finish the file, even after an error, before it might be removed
+            device = table = None
+        
+        if job.pdf_path and (self._cancelled or job.error):
+            try:
+                os.remove(job.pdf_path)
+            except OSError:
+                pass
+
+    def cancel(self):
+        """Stop after the current page"""
+        self._cancelled = True
+
+    @property
+    def cancelled(self):
+        """Whether cancel() has been called"""
+        return self._cancelled
+
+class PrintQueue(QObject):
+    """
+    Queue of print jobs run one at a time in the background.
+    
+    Features:
+    - Jobs added while others run wait their turn
+    - Keeps finished jobs so the status view can show the whole batch
+    - Cancelling stops the running job and drops the waiting ones
+    """
+    
+    changed = pyqtSignal()  # Any job's state or progress changed
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = []
+        self.page_layout = None
+        self._waiting = []
+        self._worker = None
+
+    @property
+    def busy(self):
+        """Whether a job is running or waiting"""
+        return self._worker is not None
+
+    def add(self, jobs, page_layout=None):
+        """
+        Queue jobs.
+        
+        Args:
+            jobs (list): PrintJob objects, run in order
+            page_layout (QPageLayout): Page setup for PDF jobs
+        """
+        if not self.busy:
+            # A new batch; forget jobs from the last one
+            self.jobs = []
+        if page_layout is not None:
+            self.page_layout = page_layout
+        self.jobs.extend(jobs)
+        self._waiting.extend(jobs)
+        self.changed.emit()
+        if self._worker is None:
+            self._start_next()
+
+    def cancel(self):
+        """Cancel the running job and every waiting job"""
+        for job in self._waiting:
+            job.state = CANCELLED
+        self._waiting = []
+        if self._worker is not None:
+            self._worker.cancel()
+        self.changed.emit()
+
+    def wait(self):
+        """Block until the running job stops (used on exit)"""
+        if self._worker is not None:
+            self._worker.wait()
+
+    def progress(self):
+        """
+        Get overall progress.
+        
+        Returns:
+            tuple: (finished jobs, total jobs, running job or None)
+        """
+        running = self._worker.job if self._worker is not None else None
+        return sum(job.finished for job in self.jobs), len(self.jobs), running
+
+    def _start_next(self):
+        """Start a worker for the next waiting job"""
+        if not self._waiting:
+            self._worker = None
+            self.changed.emit()
+            return
+        
+        job = self._waiting.pop(0)
+        job.state = RUNNING
+        worker = PrintJobWorker(job, self.page_layout, self)
+        worker.progress.connect(lambda done, total: self._job_progress(job, done, total))
+        worker.finished.connect(self._job_finished)
+        self._worker = worker
+        self.changed.emit()
+        worker.start()
+
+    def _job_progress(self, job, done, total):
+        job.pages_done, job.page_total = done, total
+        self.changed.emit()
+
+    def _job_finished(self):
+        worker = self._worker
+        job = worker.job
+        if job.error:
+            job.state = FAILED
+            print(f"Error printing {job.name}: {job.error}")
+        else:
+            job.state = CANCELLED if worker.cancelled else DONE
+        worker.deleteLater()
+        self._start_next()
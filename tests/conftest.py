@@ -0,0 +1,18 @@
+"""
+Shared pytest setup for MisterLister.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Run Qt without a display and import the package from the checkout
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for every test that needs Qt"""
+    from mister_lister.qt import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,97 @@
+"""
+Tests for write-behind config saving.
+"""
+
+import atexit
+import json
+import os
+import time
+
+import pytest
+
+from mister_lister.utils.config import Config
+
+def read_file(config):
+    with open(config.config_file) as f:
+        return json.load(f)
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+@pytest.fixture
+def config(tmp_path):
+    config = Config(write_delay=0.2, config_dir=str(tmp_path))
+    
+    # Count writes from here on
+    config.writes = 0
+    save_config = config.save_config
+    def counting_save():
+        config.writes += 1
+        save_config()
+    config.save_config = counting_save
+    yield config
+    if config._timer is not None:
+        config._timer.cancel()
+
+def test_changes_are_coalesced_into_one_write(config):
+    config.set_value('layout/font_size', 13)
+    config.set_value('layout/font_size', 14)
+    config.set_value('files/duplicates', 'replace')
+    config.set_value('layout/row_spacing', 40)
+    
+    # Nothing is written until the changes go quiet
+    assert read_file(config)['layout/font_size'] == 12.0
+    assert config.writes == 0
+    
+    assert wait_for(lambda: config.writes == 1)
+    time.sleep(0.3)
+    assert config.writes == 1
+    saved = read_file(config)
+    assert saved['layout/font_size'] == 14.0
+    assert saved['files/duplicates'] == 'replace'
+    assert saved['layout/row_spacing'] == 40.0
+    assert os.listdir(config.config_dir) == ['config.json']
+
+def test_flush_writes_now_and_cancels_the_timer(config):
+    config.set_value('layout/font_size', 16)
+    config.flush()
+    assert config.writes == 1
+    assert read_file(config)['layout/font_size'] == 16.0
+    
+    time.sleep(0.4)
+    assert config.writes == 1
+    config.flush()  # Nothing pending
+    assert config.writes == 1
+
+def test_pending_changes_are_flushed_at_exit(tmp_path, monkeypatch):
+    hooks = []
+    monkeypatch.setattr(atexit, 'register', hooks.append)
+    config = Config(write_delay=60, config_dir=str(tmp_path))
+    config.set_value('print/border_gray', 10)
+    config.set_value('print/border_gray', 20)
+    assert len(hooks) == 1
+    
+    hooks[0]()
+    assert config._timer is None
+    assert read_file(config)['print/border_gray'] == 20
+
+def test_failed_write_keeps_the_old_file(config):
+    config.flush()
+    before = read_file(config)
+    
+    config.config['parsing/schemas'] = {'bad': object()}  # Not JSON-serializable
+    config.save_config()
+    assert read_file(config) == before
+    assert os.listdir(config.config_dir) == ['config.json']
+
+@pytest.mark.skipif(os.name == 'nt', reason="Windows has no POSIX file modes")
+def test_save_keeps_file_mode(tmp_path):
+    config = Config(write_delay=0, config_dir=str(tmp_path))
+    os.chmod(config.config_file, 0o640)
+    config.set_value('layout/font_size', 15)
+    assert os.stat(config.config_file).st_mode & 0o777 == 0o640
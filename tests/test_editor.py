@@ -0,0 +1,94 @@
+"""
+Tests for row deletion in the main window.
+"""
+
+from functools import partial
+
+import pytest
+
+from mister_lister import editor as editor_module
+from mister_lister.editor import FileEditor, merge_row_ranges
+from mister_lister.qt import Qt, QAbstractItemView
+from mister_lister.utils import Config
+
+@pytest.mark.parametrize("ranges, blocks", [
+    ([], []),
+    ([(4, 4)], [(4, 1)]),
+    ([(0, 2), (3, 5)], [(0, 6)]),
+    ([(0, 4), (2, 6), (3, 3)], [(0, 7)]),
+    ([(9, 9), (0, 1), (5, 6), (2, 2)], [(0, 3), (5, 2), (9, 1)]),
+    ([(1, 1), (3, 3), (5, 5)], [(1, 1), (3, 1), (5, 1)]),
+    ([(2, 8), (0, 0), (4, 5), (9, 9)], [(0, 1), (2, 8)]),
+])
+def test_merge_row_ranges(ranges, blocks):
+    assert merge_row_ranges(ranges) == blocks
+
+NAMES = ["Smith_John", "Doe_Jane", "Nguyen_Ann", "Jones_Jo", "Brown_Li"]
+
+def make_paths(count):
+    return [f"/scans/{i:04}_{NAMES[i % len(NAMES)]}_{i % 12 + 1:02}0{i % 9 + 1}24.pdf" for i in range(count)]
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(editor_module, "Config", partial(Config, config_dir=str(tmp_path)))
+    window = FileEditor()
+    window.show()
+    paths = make_paths(300)
+    window.insert_rows(window.schema.parse_many(paths), paths)
+    window.table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+    yield window
+    window.close()
+    window.deleteLater()
+
+def set_filter(window, query):
+    window.bottom_bar.filter_box.setText(query)
+    window.apply_filter()
+
+def select_shown_rows(window, rows):
+    for row in rows:
+        window.table.selectRow(row)
+
+def check_indexes(window):
+    """Both indexes must describe exactly the rows left in the model"""
+    model = window.model
+    assert len(window.path_index) == model.rowCount()
+    assert len(window.search_index) == model.rowCount()
+    for row in range(model.rowCount()):
+        assert window.path_index.get(model.path(row)) == model.row_id(row)
+    for query in ["oe_", "mith", "ohn", "24", "_", "zz"]:
+        expected = {
+            model.row_id(row) for row in range(model.rowCount())
+            if any(query in value.casefold() for value in model.row_values(row))
+        }
+        assert window.search_index.search(query) == expected, query
+
+@pytest.mark.parametrize("sort_column", [None, 0, 2])
+def test_delete_while_filtered_keeps_indexes_in_sync(window, sort_column):
+    if sort_column is not None:
+        window.model.sort(sort_column, Qt.SortOrder.DescendingOrder)
+    set_filter(window, "oe_")
+    shown = window.proxy.rowCount()
+    assert 0 < shown < window.model.rowCount()
+    
+    # Scattered rows plus a contiguous run of shown rows
+    rows = sorted(set(range(0, shown, 3)) | set(range(10, 25)))
+    deleted = {window.model.path(window.proxy.source_row(row)) for row in rows}
+    select_shown_rows(window, rows)
+    window.delete_selected_rows()
+    
+    assert window.model.rowCount() == 300 - len(deleted)
+    assert window.proxy.rowCount() == shown - len(deleted)
+    assert not any(path in window.path_index for path in deleted)
+    check_indexes(window)
+    
+    # Deleted files can be added again; the rest are still duplicates
+    paths = make_paths(300)
+    window.insert_rows(window.schema.parse_many(paths), paths)
+    assert window.model.rowCount() == 300
+    check_indexes(window)
+
+def test_delete_everything(window):
+    window.table.selectAll()
+    window.delete_selected_rows()
+    assert window.model.rowCount() == 0
+    check_indexes(window)
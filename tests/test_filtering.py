@@ -0,0 +1,111 @@
+"""
+Tests for the trigram search index and the filter proxy.
+
+Every check compares the rows the proxy shows against a brute-force,
+case-insensitive substring scan of the model.
+"""
+
+import random
+
+import pytest
+
+from mister_lister.qt import Qt
+from mister_lister.ui.table_model import ListTableModel
+from mister_lister.ui.filter_proxy import FilterProxyModel
+from mister_lister.utils import TrigramIndex
+
+NAMES = ["Smith", "SMYTHE", "Straße", "STRASSE", "Doe", "Nguyen", "O'Neil", "van Dyke", "Ødegaard"]
+FIRST = ["John", "Jane", "Ann", "Anna", "Jo", "Éva", "li"]
+QUERIES = ["", "s", "a", "ss", "jo", "an", "Øde", "smith", "strasse", "STRASSE", "van d",
+           "ann", "010", "-2024", "zzz", "ohn", "e", "o'n"]
+
+def make_rows(rng, count):
+    return [
+        [rng.choice(NAMES), rng.choice(FIRST), f"{rng.randint(1, 12):02}-{rng.randint(1, 28):02}-{rng.choice([1999, 2024])}"]
+        for _ in range(count)
+    ]
+
+class Table:
+    """Model, proxy and index wired together the way the editor does it"""
+    
+    def __init__(self, rows):
+        self.model = ListTableModel(["Last", "First", "Date"])
+        self.proxy = FilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.index = TrigramIndex()
+        self.append(rows)
+    
+    def append(self, rows):
+        self.index.add_many(self.model.append_rows(rows), rows)
+    
+    def delete(self, first, count):
+        for row in range(first, first + count):
+            self.index.remove(self.model.row_id(row))
+        self.model.removeRows(first, count)
+    
+    def apply(self, query):
+        self.proxy.set_filter(query, self.index.search(query))
+    
+    def brute_force(self, query):
+        needle = query.casefold()
+        return [
+            row for row in range(self.model.rowCount())
+            if any(needle in value.casefold() for value in self.model.row_values(row))
+        ]
+    
+    def shown(self):
+        return [
+            self.proxy.mapToSource(self.proxy.index(row, 0)).row()
+            for row in range(self.proxy.rowCount())
+        ]
+    
+    def check(self, query):
+        expected = self.brute_force(query)
+        assert self.shown() == expected, query
+        assert self.index.search(query) == {self.model.row_id(row) for row in expected}, query
+        for proxy_row, source_row in enumerate(expected):
+            assert self.proxy.mapFromSource(self.model.index(source_row, 1)).row() == proxy_row
+            assert self.proxy.data(self.proxy.index(proxy_row, 2)) == self.model.cell(source_row, 2)
+
+@pytest.fixture
+def table(qapp):
+    return Table(make_rows(random.Random(1), 400))
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_filter_matches_brute_force(table, query):
+    table.apply(query)
+    table.check(query)
+
+@pytest.mark.parametrize("query", ["s", "jo", "strasse", "van d", "zzz"])
+def test_rows_added_after_filtering(table, query):
+    rng = random.Random(2)
+    table.apply(query)
+    for _ in range(5):
+        table.append(make_rows(rng, rng.randint(1, 40)))
+        table.check(query)
+
+@pytest.mark.parametrize("query", ["a", "ann", "smith", "2024"])
+def test_rows_deleted_while_filtered(table, query):
+    rng = random.Random(3)
+    table.apply(query)
+    while table.model.rowCount() > 10:
+        first = rng.randrange(table.model.rowCount())
+        table.delete(first, min(rng.randint(1, 60), table.model.rowCount() - first))
+        table.check(query)
+    table.delete(0, table.model.rowCount())
+    table.check(query)
+
+@pytest.mark.parametrize("query", ["e", "jo", "strasse", "-2024"])
+def test_sorting_while_filtered(table, query):
+    table.apply(query)
+    for spec in [
+        [(0, Qt.SortOrder.AscendingOrder)],
+        [(2, Qt.SortOrder.DescendingOrder)],
+        [(1, Qt.SortOrder.AscendingOrder), (0, Qt.SortOrder.DescendingOrder)],
+    ]:
+        table.model.sort_by(spec)
+        table.check(query)
+    
+    # Appends under an active sort land mid-table
+    table.append(make_rows(random.Random(4), 50))
+    table.check(query)
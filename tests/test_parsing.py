@@ -0,0 +1,30 @@
+"""
+Tests for serial and parallel filename parsing.
+"""
+
+import logging
+from concurrent.futures.process import BrokenProcessPool
+
+from mister_lister.utils.parsing import parse_files, MIN_CHUNK_SIZE
+
+def make_paths(count):
+    names = ["Smith_John_010224.pdf", "Doe_Jane_123199.tif", "no_date.txt", "A-B_C.D", "plain"]
+    return [f"/scans/box{i % 7}/{i}_{names[i % len(names)]}" for i in range(count)]
+
+def test_parallel_matches_serial():
+    paths = make_paths(MIN_CHUNK_SIZE * 2 + 37)
+    serial = parse_files(paths, parallel_threshold=0)
+    parallel = parse_files(paths, parallel_threshold=100, max_workers=2)
+    assert parallel == serial
+    assert len(serial) == len(paths)
+
+class BrokenPool:
+    def map(self, fn, chunks):
+        raise BrokenProcessPool("worker died")
+
+def test_broken_pool_falls_back_to_serial(caplog):
+    paths = make_paths(500)
+    with caplog.at_level(logging.WARNING, logger="mister_lister.utils.parsing"):
+        rows = parse_files(paths, parallel_threshold=100, pool=BrokenPool())
+    assert rows == parse_files(paths, parallel_threshold=0)
+    assert "parsing serially" in caplog.text
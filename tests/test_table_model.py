@@ -0,0 +1,28 @@
+"""
+Tests for the columnar table model.
+"""
+
+from mister_lister.qt import Qt
+from mister_lister.ui.table_model import ListTableModel
+
+def first_column(model):
+    return [model.cell(row, 0) for row in range(model.rowCount())]
+
+def test_replaced_rows_keep_sort_order(qapp):
+    model = ListTableModel(["Name", "Note"])
+    model.append_rows([["b", "1"], ["d", "2"], ["f", "3"]])
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    
+    model.set_rows([(model.position_of(model.row_id(0)), ["z", "1"])])
+    assert first_column(model) == ["d", "f", "z"]
+
+def test_replacements_in_bulk_sort_once_at_end(qapp):
+    model = ListTableModel(["Name"])
+    model.append_rows([["b"], ["d"], ["f"]])
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    
+    with model.bulk_insert():
+        model.set_rows([(0, ["a"])])
+        assert first_column(model) == ["a", "d", "b"]
+        model.append_rows([["c"]])
+    assert first_column(model) == ["d", "c", "b", "a"]
@@ -0,0 +1,76 @@
+"""
+Tests for filename tokenizing and date conversion.
+"""
+
+import random
+import unicodedata
+import warnings
+
+import pytest
+
+from mister_lister.utils.text_processing import (
+    split_by_type, split_many, convert_short_date, convert_many
+)
+
+def reference_split_by_type(s, *args):
+    """The original character-by-character split_by_type"""
+    if not s:
+        return []
+    args = args if args else ("A", "1")
+    type_filters = {unicodedata.category(char) for char in args}
+    result = []
+    current_segment = s[0]
+    prev_type = unicodedata.category(s[0])
+    for char in s[1:]:
+        char_type = unicodedata.category(char)
+        if prev_type in type_filters and char_type != prev_type:
+            result.append(current_segment)
+            current_segment = char
+        else:
+            current_segment += char
+        prev_type = char_type
+    result.append(current_segment)
+    return result
+
+# One sample character per interesting category, including Cf/Cs/Co/Cn,
+# whose internal codes are regex class metacharacters
+SAMPLES = {
+    'Lu': 'AZÉ', 'Ll': 'azé', 'Nd': '09٣', 'Pd': '-', 'Pc': '_', 'Po': '.,',
+    'Zs': '  ', 'Sm': '+', 'Lo': '漢', 'Mn': '́',
+    'Cf': '‍', 'Cs': '\ud800', 'Co': '', 'Cn': '͸', 'Cc': '\t',
+}
+POOL = ''.join(SAMPLES.values())
+
+FILTER_SETS = [
+    (),
+    ("A", "1"),
+    ("a",),
+    ("1", "-"),
+    ("_", " "),
+    ("‍",),
+    ("\ud800", "A"),
+    ("", "͸"),
+    ("‍", "\ud800", "", "͸", "A", "1", "-", " "),
+]
+
+@pytest.mark.parametrize("filters", FILTER_SETS)
+def test_split_matches_reference(filters):
+    rng = random.Random(7)
+    strings = [
+        "", "A", "Smith_John_010224.pdf", "ÉCOLE-2024_ab.tif",
+        *(''.join(rng.choice(POOL) for _ in range(rng.randint(1, 12))) for _ in range(300)),
+        *(''.join(rng.choice("Ab1-_ .x") for _ in range(rng.randint(1, 12))) for _ in range(300)),
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # No "Possible nested set" FutureWarning
+        for s in strings:
+            assert split_by_type(s, *filters) == reference_split_by_type(s, *filters), repr(s)
+        assert split_many(strings, *filters) == [
+            reference_split_by_type(s, *filters) for s in strings
+        ]
+
+def test_convert_short_date():
+    assert convert_short_date("010224") == "01-02-2024"
+    assert convert_short_date("023024") == "023024"
+    assert convert_short_date("12345") == "12345"
+    assert convert_many(["010224", "x", "1231"]) == ["01-02-2024", "x", "1231"]